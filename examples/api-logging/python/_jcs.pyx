@@ -0,0 +1,135 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+
+"""
+Strict RFC 8785 JSON Canonicalization Scheme (JCS) serializer
+
+Compiled helper for api_receipts.py. Build it in place with:
+    pip install cython
+    cythonize -i _jcs.pyx
+
+- Object members sorted by UTF-16 code units
+- Numbers formatted per ECMAScript Number.prototype.toString
+- Minimal string escaping, everything else emitted as UTF-8
+"""
+
+_ESCAPES = {
+    0x22: b'\\"',
+    0x5C: b'\\\\',
+    0x08: b'\\b',
+    0x09: b'\\t',
+    0x0A: b'\\n',
+    0x0C: b'\\f',
+    0x0D: b'\\r',
+}
+
+
+def canonicalize(obj) -> bytes:
+    """Serialize obj as RFC 8785 canonical JSON bytes"""
+    cdef bytearray out = bytearray()
+    _emit(out, obj)
+    return bytes(out)
+
+
+cdef _emit(bytearray out, object value):
+    cdef bint first
+    if value is None:
+        out += b'null'
+    elif value is True:
+        out += b'true'
+    elif value is False:
+        out += b'false'
+    elif isinstance(value, str):
+        _emit_string(out, <str>value)
+    elif isinstance(value, int):
+        out += str(value).encode('ascii')
+    elif isinstance(value, float):
+        out += _format_number(<double>value).encode('ascii')
+    elif isinstance(value, dict):
+        out += b'{'
+        first = True
+        for key in sorted(value, key=_utf16_key):
+            if not isinstance(key, str):
+                raise TypeError(f"JCS object keys must be strings, got {type(key).__name__}")
+            if not first:
+                out += b','
+            first = False
+            _emit_string(out, <str>key)
+            out += b':'
+            _emit(out, value[key])
+        out += b'}'
+    elif isinstance(value, (list, tuple)):
+        out += b'['
+        first = True
+        for item in value:
+            if not first:
+                out += b','
+            first = False
+            _emit(out, item)
+        out += b']'
+    else:
+        raise TypeError(f"Type {type(value).__name__} is not JSON serializable")
+
+
+def _utf16_key(key):
+    return key.encode('utf-16-be') if isinstance(key, str) else key
+
+
+cdef _emit_string(bytearray out, str text):
+    cdef Py_ssize_t start = 0
+    cdef Py_ssize_t i
+    cdef Py_ssize_t length = len(text)
+    cdef Py_UCS4 ch
+
+    out += b'"'
+    for i in range(length):
+        ch = text[i]
+        if ch < 0x20 or ch == 0x22 or ch == 0x5C:
+            if i > start:
+                out += text[start:i].encode('utf-8')
+            escape = _ESCAPES.get(<int>ch)
+            out += escape if escape is not None else b'\\u%04x' % <int>ch
+            start = i + 1
+    if length > start:
+        out += text[start:].encode('utf-8')
+    out += b'"'
+
+
+cdef str _format_number(double value):
+    """ECMAScript Number.prototype.toString for finite doubles"""
+    cdef str sign = ''
+    cdef str mantissa, digits
+    cdef int exponent = 0
+    cdef int k, n
+
+    if value != value or value in (float('inf'), float('-inf')):
+        raise ValueError("NaN and Infinity are not allowed in JCS")
+    if value == 0:
+        return '0'
+    if value < 0:
+        sign = '-'
+        value = -value
+
+    # repr() yields the shortest round-tripping digits, as ECMAScript does
+    mantissa = repr(value)
+    if 'e' in mantissa:
+        mantissa, exp_part = mantissa.split('e')
+        exponent = int(exp_part)
+    int_part, _, frac_part = mantissa.partition('.')
+    digits = (int_part + frac_part).lstrip('0')
+    # n is the decimal point position: value == 0.<digits> * 10**n
+    n = len(int_part) + exponent - (len(int_part) + len(frac_part) - len(digits))
+    digits = digits.rstrip('0')
+    k = len(digits)
+
+    if k <= n <= 21:
+        return sign + digits + '0' * (n - k)
+    if 0 < n <= 21:
+        return sign + digits[:n] + '.' + digits[n:]
+    if -6 < n <= 0:
+        return sign + '0.' + '0' * (-n) + digits
+
+    exponent = n - 1
+    exp_str = ('e+' if exponent >= 0 else 'e-') + str(abs(exponent))
+    if k == 1:
+        return sign + digits + exp_str
+    return sign + digits[0] + '.' + digits[1:] + exp_str
@@ -15,29 +15,175 @@ Features:
 - JWKS endpoint for public key distribution
 
 Usage:
-    pip install fastapi uvicorn cryptography
+    pip install fastapi uvicorn cryptography orjson
     python api_receipts.py
+
+Optional SIMD base64:
+    pip install pybase64
+
+Optional strict RFC 8785 canonicalizer (compiled):
+    pip install cython
+    cythonize -i _jcs.pyx
 """
 
 import json
 import hashlib
+import os
+import platform
+import ssl
 import time
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
-from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 import asyncio
+import orjson
 from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.base import BaseHTTPMiddleware
-from fastapi.responses import JSONResponse
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature, encode_dss_signature
 from cryptography.hazmat.primitives.serialization import Encoding, PrivateFormat, NoEncryption
-import base64
-import uuid
+
+# pybase64 is a SIMD-accelerated drop-in for the stdlib base64 module
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+try:
+    from _jcs import canonicalize as jcs_canonicalize
+except ImportError:
+    jcs_canonicalize = None
+
+
+def detect_sha256_acceleration() -> Dict[str, Any]:
+    """
+    Report whether hashlib's SHA-256 can use CPU SHA extensions
+
+    hashlib delegates to OpenSSL, which selects SHA-NI (x86_64) or the ARMv8
+    crypto extensions at runtime when the CPU advertises them.
+
+    hardware_accelerated is None when the CPU flags can't be read (no
+    /proc/cpuinfo, e.g. macOS or Windows), rather than a false negative.
+    """
+    cpu_flags = None
+    try:
+        with open("/proc/cpuinfo") as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith(("flags", "Features")):
+                    cpu_flags = line
+                    break
+    except OSError:
+        pass
+
+    if cpu_flags is None:
+        accelerated = None
+    else:
+        accelerated = bool(set(cpu_flags.partition(":")[2].split()) & {"sha_ni", "sha2"})
+
+    return {
+        "openssl": ssl.OPENSSL_VERSION,
+        "machine": platform.machine(),
+        "sha256_available": "sha256" in hashlib.algorithms_available,
+        "hardware_accelerated": accelerated,
+    }
+
+
+def describe_acceleration(accelerated: Optional[bool]) -> str:
+    """yes / no / unknown for a hardware_accelerated value"""
+    return "unknown" if accelerated is None else ("yes" if accelerated else "no")
+
+
+SHA256_BACKEND = detect_sha256_acceleration()
+
+
+# (unix second, "YYYY-MM-DDTHH:MM:SS") for the most recent timestamp
+_ISO_CACHE = (0, "")
+
+
+def fast_iso_utc() -> str:
+    """
+    Current UTC time as ISO 8601 with microseconds
+
+    Formats the date/time prefix once per second and appends the
+    sub-second part, avoiding a datetime construction per receipt.
+    """
+    global _ISO_CACHE
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    if sec != _ISO_CACHE[0]:
+        _ISO_CACHE = (sec, datetime.fromtimestamp(sec, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S"))
+    return f"{_ISO_CACHE[1]}.{ns // 1000:06d}Z"
+
+
+# Private key and ECDSA context held by each signing worker process
+_worker_private_key: Optional[ec.EllipticCurvePrivateKey] = None
+_worker_ecdsa_algo: Optional[ec.ECDSA] = None
 
 
-@dataclass
+def _init_sign_worker(private_key_pem: bytes):
+    """Load the signing key once per worker process"""
+    global _worker_private_key, _worker_ecdsa_algo
+    _worker_private_key = serialization.load_pem_private_key(private_key_pem, password=None)
+    _worker_ecdsa_algo = ec.ECDSA(hashes.SHA256())
+
+
+def _sign_batch_worker(signing_inputs: List[bytes]) -> List[bytes]:
+    """Sign a batch of JWS signing inputs in a worker process (raw r||s)"""
+    return [
+        CertNodeAPIReceiptGenerator._der_to_jose(_worker_private_key.sign(signing_input, _worker_ecdsa_algo))
+        for signing_input in signing_inputs
+    ]
+
+
+def canonical_json_bytes(data: Any) -> bytes:
+    """Canonical JSON bytes from the compiled _jcs extension, or orjson with sorted keys"""
+    if jcs_canonicalize is not None:
+        return jcs_canonicalize(data)
+    return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+
+
+# Set by CanonicalJSONResponse so the middleware can sign the body as-is
+CANONICAL_HEADER = "x-certnode-canonical"
+
+
+class CanonicalJSONResponse(Response):
+    """
+    JSON response rendered in canonical form
+
+    Handlers that return this let the receipt middleware hash and sign the
+    body bytes directly, skipping enrichment and re-canonicalization.
+    """
+    media_type = "application/json"
+
+    def __init__(self, content: Any, status_code: int = 200, headers: Optional[Dict[str, str]] = None, **kwargs):
+        super().__init__(content, status_code=status_code, headers=headers, **kwargs)
+        self.headers[CANONICAL_HEADER] = "1"
+
+    def render(self, content: Any) -> bytes:
+        return canonical_json_bytes(content)
+
+
+def _json_equal(a: Any, b: Any) -> bool:
+    """JSON structural equality that, unlike ==, keeps true/false apart from 1/0"""
+    if isinstance(a, dict):
+        return (isinstance(b, dict) and a.keys() == b.keys()
+                and all(_json_equal(value, b[key]) for key, value in a.items()))
+    if isinstance(a, list):
+        return isinstance(b, list) and len(a) == len(b) and all(map(_json_equal, a, b))
+    if isinstance(a, bool) or isinstance(b, bool):
+        return a is b
+    return a == b
+
+
+class _ShapeMismatch(Exception):
+    """Raised by a specialized canonicalizer when its input has another shape"""
+
+
+@dataclass(slots=True)
 class ApiReceipt:
     """CertNode-compliant API response receipt"""
     protected: str
@@ -48,6 +194,21 @@ class ApiReceipt:
     receipt_id: str
     api_endpoint: str
     response_time_ms: int
+    encoded_payload: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict form of the receipt, without dataclasses.asdict reflection"""
+        return {
+            "protected": self.protected,
+            "payload": self.payload,
+            "signature": self.signature,
+            "kid": self.kid,
+            "payload_jcs_sha256": self.payload_jcs_sha256,
+            "receipt_id": self.receipt_id,
+            "api_endpoint": self.api_endpoint,
+            "response_time_ms": self.response_time_ms,
+            "encoded_payload": self.encoded_payload
+        }
 
 
 class CertNodeAPIReceiptGenerator:
@@ -61,12 +222,15 @@ class CertNodeAPIReceiptGenerator:
     - Automatic key rotation preparation
     """
 
-    def __init__(self):
+    def __init__(self, sign_workers: int = 0):
         # Generate ECDSA P-256 key pair
         # In production, load from secure key management service
         self.private_key = ec.generate_private_key(ec.SECP256R1())
         self.public_key = self.private_key.public_key()
 
+        # The ECDSA/SHA-256 signature algorithm is stateless, so share one instance
+        self._ecdsa_algo = ec.ECDSA(hashes.SHA256())
+
         # Generate key ID (simplified JWK thumbprint)
         public_pem = self.public_key.public_key_bytes(
             encoding=Encoding.PEM,
@@ -74,95 +238,314 @@ class CertNodeAPIReceiptGenerator:
         )
         self.key_id = hashlib.sha256(public_pem).hexdigest()[:16]
 
+        # The protected header only depends on key_id, so encode it once
+        self._protected_header_bytes = json.dumps(
+            {"alg": "ES256", "kid": self.key_id, "typ": "JWS"},
+            separators=(',', ':')
+        ).encode('utf-8')
+        self._encoded_header_bytes = self.base64url_encode_bytes(self._protected_header_bytes)
+        self._encoded_header = self._encoded_header_bytes.decode('ascii')
+
+        # JWKS never changes for this key, so build and serialize it once
+        self._jwks = self._build_jwks()
+        self._jwks_bytes = orjson.dumps(self._jwks)
+
+        # Specialized canonicalizers keyed by top-level key order
+        self.max_specialized_shapes = 256
+        self._schema_cache: Dict[tuple, Callable[[Dict[str, Any]], bytes]] = {}
+
+        # Batched signer state (started lazily on the running event loop)
+        self.sign_batch_size = 64
+        self._sign_queue: Optional[asyncio.Queue] = None
+        self._signer_task: Optional[asyncio.Task] = None
+        self._signer_loop_ref: Optional[asyncio.AbstractEventLoop] = None
+
+        # Signing worker processes, opt-in (e.g. os.cpu_count()); 0 signs on
+        # the event loop thread. Call close() to stop the pool.
+        self.sign_workers = sign_workers
+        self._sign_pool: Optional[ProcessPoolExecutor] = None
+        self._pool_batches: set = set()
+
         # Performance metrics
         self.receipt_count = 0
         self.total_time_ms = 0
 
-    def canonicalize_json(self, data: Any) -> str:
+    async def _enqueue_sign(self, signing_input: bytes) -> bytes:
+        """Queue signing input for the batched signer and await its signature"""
+        loop = asyncio.get_running_loop()
+        if self._signer_loop_ref is not loop or self._signer_task.done():
+            self._sign_queue = asyncio.Queue()
+            self._signer_loop_ref = loop
+            self._signer_task = loop.create_task(self._signer_loop())
+            if self.sign_workers and self._sign_pool is None:
+                self._start_sign_pool()
+
+        future = loop.create_future()
+        self._sign_queue.put_nowait((signing_input, future))
+        return await future
+
+    def close(self):
+        """Shut down the signing worker pool, if one was started"""
+        pool, self._sign_pool = self._sign_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def _start_sign_pool(self):
+        """Start the signing worker pool, handing each worker the key once"""
+        # The unencrypted PKCS8 copy exists only to ship the key to workers,
+        # so it is built here rather than kept on the instance
+        private_key_pem = self.private_key.private_bytes(
+            encoding=Encoding.PEM,
+            format=PrivateFormat.PKCS8,
+            encryption_algorithm=NoEncryption()
+        )
+        self._sign_pool = ProcessPoolExecutor(
+            max_workers=self.sign_workers,
+            initializer=_init_sign_worker,
+            initargs=(private_key_pem,)
+        )
+
+    async def _signer_loop(self):
+        """
+        Drain queued signing requests and sign them in batches
+
+        Coalesces concurrent receipts into batches of up to sign_batch_size.
+        With a worker pool each batch is signed in another process, so
+        signing no longer blocks the event loop and scales with cores.
+        """
+        queue = self._sign_queue
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.sign_batch_size:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            batch = [(signing_input, future) for signing_input, future in batch if not future.done()]
+            if not batch:
+                continue
+
+            if self._sign_pool is not None:
+                task = loop.create_task(self._sign_batch_in_pool(batch))
+                self._pool_batches.add(task)
+                task.add_done_callback(self._pool_batches.discard)
+                continue
+
+            self._sign_batch_inline(batch)
+
+    def _sign_batch_inline(self, batch):
+        """Sign one batch on the calling thread and resolve its futures"""
+        for signing_input, future in batch:
+            if future.done():
+                continue
+            try:
+                der_signature = self.private_key.sign(signing_input, self._ecdsa_algo)
+                future.set_result(self._der_to_jose(der_signature))
+            except Exception as error:
+                future.set_exception(error)
+
+    async def _sign_batch_in_pool(self, batch):
+        """Sign one batch in the worker pool and resolve its futures"""
+        loop = asyncio.get_running_loop()
+        pool = self._sign_pool
+        try:
+            signatures = await loop.run_in_executor(
+                pool, _sign_batch_worker, [signing_input for signing_input, _ in batch]
+            )
+        except BrokenProcessPool:
+            # A worker died and the pool rejects all further work: replace it
+            # (once, if several batches see the breakage) and sign this batch
+            # in-process so its receipts still succeed
+            if self._sign_pool is pool:
+                pool.shutdown(wait=False)
+                self._start_sign_pool()
+            self._sign_batch_inline(batch)
+            return
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for (_, future), signature in zip(batch, signatures):
+            if not future.done():
+                future.set_result(signature)
+
+    @staticmethod
+    def _der_to_jose(der_signature: bytes) -> bytes:
+        """Convert a DER ECDSA signature to the raw 64-byte r||s form used by ES256"""
+        r, s = decode_dss_signature(der_signature)
+        return r.to_bytes(32, 'big') + s.to_bytes(32, 'big')
+
+    @staticmethod
+    def _jose_to_der(jose_signature: bytes) -> bytes:
+        """Convert a raw 64-byte ES256 signature back to DER for verification"""
+        if len(jose_signature) != 64:
+            raise ValueError("ES256 signature must be 64 bytes")
+        return encode_dss_signature(
+            int.from_bytes(jose_signature[:32], 'big'),
+            int.from_bytes(jose_signature[32:], 'big')
+        )
+
+    def canonicalize_json(self, data: Any) -> bytes:
         """
         RFC 8785 JSON Canonicalization Scheme implementation
 
-        For production, use a proper JCS library for full compliance
+        Uses the compiled _jcs extension when it has been built, which follows
+        RFC 8785 exactly. Otherwise serializes in a single orjson pass with
+        sorted keys and compact separators, which matches JCS except for
+        float exponent formatting and non-BMP key ordering
         """
-        if isinstance(data, dict):
-            # Sort keys and recursively canonicalize
-            sorted_items = sorted(data.items())
-            canonical_dict = {k: self.canonicalize_json(v) for k, v in sorted_items}
-            return json.dumps(canonical_dict, separators=(',', ':'), ensure_ascii=False)
-        elif isinstance(data, list):
-            return json.dumps([self.canonicalize_json(item) for item in data],
-                            separators=(',', ':'), ensure_ascii=False)
-        else:
-            return data
+        return canonical_json_bytes(data)
+
+    def canonicalize_known_shape(self, data: Dict[str, Any]) -> bytes:
+        """
+        Canonicalize a response using a canonicalizer specialized for its shape
+
+        Endpoints return the same key layout on every call, so the first
+        payload of each shape is compiled into a function with the sorted key
+        order and key encodings baked in. Output is identical to
+        canonicalize_json; any payload that deviates from the compiled shape
+        falls back to it.
+        """
+        shape = tuple(data)
+        specialized = self._schema_cache.get(shape)
+        if specialized is None:
+            if len(self._schema_cache) >= self.max_specialized_shapes:
+                return self.canonicalize_json(data)
+            specialized = self._compile_canonicalizer(data)
+            self._schema_cache[shape] = specialized
+
+        try:
+            return specialized(data)
+        except _ShapeMismatch:
+            return self.canonicalize_json(data)
+
+    def _compile_canonicalizer(self, sample: Dict[str, Any]) -> Callable[[Dict[str, Any]], bytes]:
+        """Generate source for a shape-specialized canonicalizer and exec it"""
+        namespace: Dict[str, Any] = {"_canon": self.canonicalize_json, "_ShapeMismatch": _ShapeMismatch}
+        guards: List[str] = []
+        expression = self._shape_expression(sample, "d", guards, namespace)
+
+        lines = ["def _specialized(d):"]
+        lines += [f"    if {guard}: raise _ShapeMismatch" for guard in guards]
+        lines.append(f"    return {expression}")
+        exec("\n".join(lines), namespace)
+        return namespace["_specialized"]
+
+    def _shape_expression(self, value: Any, accessor: str, guards: List[str], namespace: Dict[str, Any]) -> str:
+        """Expression emitting canonical bytes for value, specializing nested objects"""
+        if type(value) is not dict or not value or not all(type(key) is str for key in value):
+            return f"_canon({accessor})"
+
+        shape_name = f"_S{len(namespace)}"
+        namespace[shape_name] = tuple(value)
+        guards.append(f"type({accessor}) is not dict or tuple({accessor}) != {shape_name}")
+
+        # Let the backend decide member order so the output always matches it
+        ordered_keys = list(orjson.loads(self.canonicalize_json(dict.fromkeys(value))))
+
+        parts = []
+        for index, key in enumerate(ordered_keys):
+            prefix_name = f"_K{len(namespace)}"
+            namespace[prefix_name] = (b'{' if index == 0 else b',') + self.canonicalize_json(key) + b':'
+            parts.append(prefix_name)
+            parts.append(self._shape_expression(value[key], f"{accessor}[{key!r}]", guards, namespace))
+        parts.append("b'}'")
+        return f"b''.join(({', '.join(parts)}))"
 
     def base64url_encode(self, data: bytes) -> str:
         """Base64URL encoding without padding"""
         return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
 
+    def base64url_decode(self, data: str) -> bytes:
+        """Base64URL decoding, restoring stripped padding"""
+        return base64.urlsafe_b64decode(data + '=' * (-len(data) % 4))
+
+    def base64url_encode_bytes(self, data: bytes) -> bytes:
+        """Base64URL encoding without padding, kept as ASCII bytes"""
+        return base64.urlsafe_b64encode(data).rstrip(b'=')
+
     async def generate_receipt(
         self,
         response_data: Dict[str, Any],
         endpoint: str,
         request_id: str,
-        response_time_ms: int
+        response_time_ms: int,
+        canonical_body: Optional[bytes] = None
     ) -> ApiReceipt:
         """
         Generate CertNode-compliant receipt for API response
 
-        Optimized for high-throughput scenarios with minimal CPU overhead
+        Optimized for high-throughput scenarios with minimal CPU overhead.
+        When canonical_body is given (the response was serialized by
+        CanonicalJSONResponse), those bytes are signed as-is and the receipt
+        metadata moves into the protected header instead of the payload.
         """
         start_time = time.perf_counter()
 
         try:
-            # 1. Enrich response data with receipt metadata
-            enriched_response = {
-                **response_data,
-                "_receipt_meta": {
-                    "generated_at": datetime.now(timezone.utc).isoformat(),
-                    "request_id": request_id,
-                    "api_version": "1.0",
-                    "standard": "CertNode/1.1.0"
-                }
+            receipt_meta = {
+                "generated_at": fast_iso_utc(),
+                "request_id": request_id,
+                "api_version": "1.0",
+                "standard": "CertNode/1.1.0"
             }
 
-            # 2. Canonicalize payload (RFC 8785 JCS)
-            canonical_payload = self.canonicalize_json(enriched_response)
+            if canonical_body is None:
+                # 1. Enrich response data with receipt metadata
+                payload = {**response_data, "_receipt_meta": receipt_meta}
 
-            # 3. Create JWS protected header
-            protected_header = {
-                "alg": "ES256",
-                "kid": self.key_id,
-                "typ": "JWS"
-            }
+                # 2. Canonicalize payload (RFC 8785 JCS)
+                canonical_payload = self.canonicalize_known_shape(payload)
 
-            encoded_header = self.base64url_encode(
-                json.dumps(protected_header, separators=(',', ':')).encode('utf-8')
-            )
-            encoded_payload = self.base64url_encode(canonical_payload.encode('utf-8'))
+                # 3. Reuse the precomputed JWS protected header
+                encoded_header_bytes = self._encoded_header_bytes
+            else:
+                # 1-2. Body is already canonical, sign it without re-serializing
+                payload = response_data
+                canonical_payload = canonical_body
+
+                # 3. Carry the receipt metadata in the protected header
+                encoded_header_bytes = self.base64url_encode_bytes(json.dumps(
+                    {"alg": "ES256", "kid": self.key_id, "typ": "JWS", "_receipt_meta": receipt_meta},
+                    separators=(',', ':')
+                ).encode('utf-8'))
+
+            encoded_header = encoded_header_bytes.decode('ascii')
+            encoded_payload_bytes = self.base64url_encode_bytes(canonical_payload)
+            encoded_payload = encoded_payload_bytes.decode('ascii')
 
             # 4. Create signature
-            signing_input = f"{encoded_header}.{encoded_payload}".encode('utf-8')
-            signature = self.private_key.sign(signing_input, ec.ECDSA(hashes.SHA256()))
-            encoded_signature = self.base64url_encode(signature)
+            signing_input = encoded_header_bytes + b'.' + encoded_payload_bytes
+            signature = await self._enqueue_sign(signing_input)
+            encoded_signature_bytes = self.base64url_encode_bytes(signature)
+            encoded_signature = encoded_signature_bytes.decode('ascii')
 
-            # 5. Generate receipt ID
-            complete_jws = f"{encoded_header}.{encoded_payload}.{encoded_signature}"
-            receipt_id = hashlib.sha256(complete_jws.encode('utf-8')).hexdigest()[:32]
+            # 5. Generate receipt ID by hashing the JWS segments in place
+            receipt_hasher = hashlib.sha256(signing_input)
+            receipt_hasher.update(b'.')
+            receipt_hasher.update(encoded_signature_bytes)
+            receipt_id = receipt_hasher.hexdigest()[:32]
 
             # 6. Calculate payload hash
-            payload_hash = hashlib.sha256(canonical_payload.encode('utf-8')).digest()
+            payload_hash = hashlib.sha256(canonical_payload).digest()
             payload_jcs_sha256 = self.base64url_encode(payload_hash)
 
             # 7. Create receipt
             receipt = ApiReceipt(
                 protected=encoded_header,
-                payload=enriched_response,
+                payload=payload,
                 signature=encoded_signature,
                 kid=self.key_id,
                 payload_jcs_sha256=payload_jcs_sha256,
                 receipt_id=receipt_id,
                 api_endpoint=endpoint,
-                response_time_ms=response_time_ms
+                response_time_ms=response_time_ms,
+                encoded_payload=encoded_payload
             )
 
             # Update performance metrics
@@ -183,17 +566,26 @@ class CertNodeAPIReceiptGenerator:
         Returns verification result with detailed information
         """
         try:
-            # 1. Reconstruct signing input
-            canonical_payload = self.canonicalize_json(receipt.payload)
-            encoded_payload = self.base64url_encode(canonical_payload.encode('utf-8'))
+            # 1. Reconstruct signing input, reusing the signed payload segment
+            #    when the receipt carries it instead of re-canonicalizing
+            if receipt.encoded_payload is not None:
+                encoded_payload = receipt.encoded_payload
+                canonical_payload = self.base64url_decode(encoded_payload)
+                payload_valid = _json_equal(orjson.loads(canonical_payload), receipt.payload)
+            else:
+                canonical_payload = self.canonicalize_json(receipt.payload)
+                encoded_payload = self.base64url_encode(canonical_payload)
+                payload_valid = True
             signing_input = f"{receipt.protected}.{encoded_payload}".encode('utf-8')
 
             # 2. Decode signature
-            signature = base64.urlsafe_b64decode(receipt.signature + '==')
+            signature = self.base64url_decode(receipt.signature)
 
             # 3. Verify signature
             try:
-                self.public_key.verify(signature, signing_input, ec.ECDSA(hashes.SHA256()))
+                self.public_key.verify(
+                    self._jose_to_der(signature), signing_input, self._ecdsa_algo
+                )
                 signature_valid = True
             except Exception:
                 signature_valid = False
@@ -204,32 +596,29 @@ class CertNodeAPIReceiptGenerator:
             receipt_id_valid = calculated_receipt_id == receipt.receipt_id
 
             # 5. Verify payload hash
-            payload_hash = hashlib.sha256(canonical_payload.encode('utf-8')).digest()
+            payload_hash = hashlib.sha256(canonical_payload).digest()
             calculated_hash = self.base64url_encode(payload_hash)
             payload_hash_valid = calculated_hash == receipt.payload_jcs_sha256
 
             return {
-                "valid": signature_valid and receipt_id_valid and payload_hash_valid,
+                "valid": signature_valid and receipt_id_valid and payload_hash_valid and payload_valid,
                 "signature_valid": signature_valid,
+                "payload_valid": payload_valid,
                 "receipt_id_valid": receipt_id_valid,
                 "payload_hash_valid": payload_hash_valid,
                 "receipt_id": receipt.receipt_id,
-                "verified_at": datetime.now(timezone.utc).isoformat()
+                "verified_at": fast_iso_utc()
             }
 
         except Exception as error:
             return {
                 "valid": False,
                 "error": str(error),
-                "verified_at": datetime.now(timezone.utc).isoformat()
+                "verified_at": fast_iso_utc()
             }
 
-    def get_jwks(self) -> Dict[str, Any]:
-        """
-        Generate JWKS for public key distribution
-
-        Enables other systems to verify receipts independently
-        """
+    def _build_jwks(self) -> Dict[str, Any]:
+        """Build the JWKS for the current key pair"""
         # Get public key coordinates (simplified for example)
         public_numbers = self.public_key.public_numbers()
 
@@ -245,6 +634,19 @@ class CertNodeAPIReceiptGenerator:
             }]
         }
 
+    def get_jwks(self) -> Dict[str, Any]:
+        """
+        Get JWKS for public key distribution
+
+        Enables other systems to verify receipts independently. The JWKS is
+        immutable for the life of the key, so it is built once at init.
+        """
+        return self._jwks
+
+    def get_jwks_bytes(self) -> bytes:
+        """Serialized JWKS, ready to send as a response body"""
+        return self._jwks_bytes
+
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get receipt generation performance statistics"""
         if self.receipt_count == 0:
@@ -254,7 +656,8 @@ class CertNodeAPIReceiptGenerator:
             "receipts_generated": self.receipt_count,
             "total_time_ms": round(self.total_time_ms, 2),
             "average_time_ms": round(self.total_time_ms / self.receipt_count, 3),
-            "throughput_per_second": round(1000 / (self.total_time_ms / self.receipt_count))
+            "throughput_per_second": round(1000 / (self.total_time_ms / self.receipt_count)),
+            "sha256_hardware_accelerated": SHA256_BACKEND["hardware_accelerated"]
         }
 
 
@@ -275,7 +678,7 @@ class CertNodeReceiptMiddleware(BaseHTTPMiddleware):
         start_time = time.perf_counter()
 
         # Generate unique request ID
-        request_id = str(uuid.uuid4())
+        request_id = os.urandom(16).hex()
 
         # Process request
         response = await call_next(request)
@@ -288,32 +691,38 @@ class CertNodeReceiptMiddleware(BaseHTTPMiddleware):
             and response.status_code == 200):
 
             # Get response body
-            body = b""
+            chunks = []
             async for chunk in response.body_iterator:
-                body += chunk
+                chunks.append(chunk)
+            body = b"".join(chunks)
 
             try:
                 # Parse JSON response
-                response_data = json.loads(body.decode())
+                response_data = orjson.loads(body)
+
+                # Canonical bodies are signed as-is, without re-canonicalizing
+                is_canonical = response.headers.get(CANONICAL_HEADER) == "1"
 
                 # Generate receipt
                 receipt = await self.generator.generate_receipt(
                     response_data=response_data,
                     endpoint=str(request.url.path),
                     request_id=request_id,
-                    response_time_ms=response_time_ms
+                    response_time_ms=response_time_ms,
+                    canonical_body=body if is_canonical else None
                 )
 
-                # Create response with receipt
-                receipt_response = {
+                # Serialize response with receipt in a single pass
+                receipt_body = orjson.dumps({
                     "data": response_data,
-                    "certnode_receipt": asdict(receipt)
-                }
+                    "certnode_receipt": receipt.to_dict()
+                })
 
-                return JSONResponse(
-                    content=receipt_response,
+                return Response(
+                    content=receipt_body,
                     status_code=response.status_code,
-                    headers=dict(response.headers)
+                    headers=self._client_headers(response),
+                    media_type="application/json"
                 )
 
             except Exception as error:
@@ -322,20 +731,44 @@ class CertNodeReceiptMiddleware(BaseHTTPMiddleware):
                 return Response(
                     content=body,
                     status_code=response.status_code,
-                    headers=dict(response.headers)
+                    headers=self._client_headers(response)
                 )
 
+        if CANONICAL_HEADER in response.headers:
+            del response.headers[CANONICAL_HEADER]
         return response
 
+    @staticmethod
+    def _client_headers(response) -> Dict[str, str]:
+        """
+        Headers to send with a rebuilt body
+
+        Drops the internal canonical marker, and the original Content-Length
+        so Response recomputes it for the new body
+        """
+        return {
+            key: value for key, value in response.headers.items()
+            if key not in ("content-length", CANONICAL_HEADER)
+        }
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Stop the receipt generator's signing workers when the server shuts down"""
+    yield
+    receipt_generator.close()
+
 
 # FastAPI application with CertNode receipt integration
 app = FastAPI(
     title="CertNode API Receipt Example",
     description="Demonstrates tamper-evident API responses using CertNode standard",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# Initialize receipt generator
+# Initialize receipt generator (signs inline; pass sign_workers=os.cpu_count()
+# to sign in worker processes)
 receipt_generator = CertNodeAPIReceiptGenerator()
 
 # Add receipt middleware
@@ -379,12 +812,13 @@ async def list_orders(limit: int = 10):
             "created_at": f"2025-01-{15 + (i % 10):02d}T10:30:00Z"
         })
 
-    return {
+    # Canonical rendering lets the middleware sign the body without re-serializing
+    return CanonicalJSONResponse({
         "orders": orders,
         "total_count": len(orders),
         "page": 1,
         "limit": limit
-    }
+    })
 
 
 @app.post("/api/verify-receipt")
@@ -406,7 +840,7 @@ async def verify_receipt(receipt_data: dict):
 @app.get("/.well-known/jwks.json")
 async def get_jwks():
     """JWKS endpoint for public key distribution"""
-    return receipt_generator.get_jwks()
+    return Response(content=receipt_generator.get_jwks_bytes(), media_type="application/json")
 
 
 @app.get("/api/receipt-stats")
@@ -452,36 +886,42 @@ async def performance_test():
         "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
-    # Warm up
-    for _ in range(100):
-        await receipt_generator.generate_receipt(
-            test_data, "/test", "warmup", 50
-        )
+    batch_size = receipt_generator.sign_batch_size
+    total_receipts = 1000
+
+    # Warm up (also starts the signer task and worker pool)
+    await asyncio.gather(*[
+        receipt_generator.generate_receipt(test_data, "/test", "warmup", 50)
+        for _ in range(100)
+    ])
 
     # Reset stats
     receipt_generator.receipt_count = 0
     receipt_generator.total_time_ms = 0
 
-    # Performance test
+    # Performance test: concurrent batches, as under production load
     start_time = time.perf_counter()
 
-    for i in range(1000):
-        await receipt_generator.generate_receipt(
-            test_data, f"/test/{i}", f"req_{i}", 50
-        )
+    for base in range(0, total_receipts, batch_size):
+        await asyncio.gather(*[
+            receipt_generator.generate_receipt(test_data, f"/test/{i}", f"req_{i}", 50)
+            for i in range(base, min(base + batch_size, total_receipts))
+        ])
 
     total_time = (time.perf_counter() - start_time) * 1000
     stats = receipt_generator.get_performance_stats()
 
-    print(f"✅ Generated 1000 receipts in {total_time:.2f}ms")
-    print(f"📊 Average generation time: {stats['average_time_ms']}ms")
-    print(f"🚀 Throughput: {stats['throughput_per_second']} receipts/second")
+    print(f"✅ Generated {total_receipts} receipts in {total_time:.2f}ms")
+    print(f"📊 Average generation latency: {stats['average_time_ms']}ms")
+    print(f"🚀 Throughput: {round(total_receipts / (total_time / 1000))} receipts/second")
+    print(f"🔐 SHA-256 hardware acceleration: {describe_acceleration(SHA256_BACKEND['hardware_accelerated'])}")
     print(f"💾 Memory efficiency: ~{stats['average_time_ms'] * 1024:.0f} bytes/receipt")
 
 
 if __name__ == "__main__":
     print("🚀 CertNode API Receipt Example")
     print("===============================")
+    print(f"SHA-256 hardware acceleration: {describe_acceleration(SHA256_BACKEND['hardware_accelerated'])} ({SHA256_BACKEND['openssl']})")
     print("Starting FastAPI server with automatic receipt generation...")
     print("\\n📚 Available endpoints:")
     print("   • GET /api/users/{user_id} - Get user data with receipt")
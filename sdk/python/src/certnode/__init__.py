@@ -28,7 +28,7 @@ Example:
     >>> print("Valid!" if result.ok else f"Invalid: {result.reason}")
 """
 
-from .verification import verify_receipt, VerifyResult
+from .verification import verify_receipt, verify_receipts, VerifyResult
 from .jwks import JWKSManager
 from .exceptions import CertNodeError, VerificationError, JWKSError
 
@@ -38,6 +38,7 @@ __email__ = "noreply@certnode.io"
 
 __all__ = [
     "verify_receipt",
+    "verify_receipts",
     "VerifyResult",
     "JWKSManager",
     "CertNodeError",
@@ -0,0 +1,115 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+
+"""
+Compiled canonical JSON serializer for certnode.utils
+
+Emits exactly the bytes of the pure-Python canonicalize_json path, writing
+UTF-8 straight into one buffer. Build it in place with:
+    pip install cython
+    cythonize -i src/certnode/_fast.pyx
+
+- Object members sorted by key, members with a None value dropped
+- Numbers formatted like json.dumps
+- Minimal string escaping, everything else emitted as UTF-8
+
+Shapes outside plain dict/list/str/int/float/bool/None (subclasses, tuples,
+non-string keys, very deep nesting) return None so the caller can fall back.
+"""
+
+_ESCAPES = {
+    0x22: b'\\"',
+    0x5C: b'\\\\',
+    0x08: b'\\b',
+    0x09: b'\\t',
+    0x0A: b'\\n',
+    0x0C: b'\\f',
+    0x0D: b'\\r',
+}
+
+cdef int _MAX_DEPTH = 256
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def canonicalize(obj):
+    """Serialize obj as canonical JSON bytes, or None if obj needs the Python path"""
+    cdef bytearray out = bytearray()
+    try:
+        _emit(out, obj, 0)
+    except _Unsupported:
+        return None
+    return bytes(out)
+
+
+cdef _emit(bytearray out, object value, int depth):
+    cdef bint first
+    cdef type kind = type(value)
+
+    if value is None:
+        out += b'null'
+    elif value is True:
+        out += b'true'
+    elif value is False:
+        out += b'false'
+    elif kind is str:
+        _emit_string(out, <str>value)
+    elif kind is int:
+        out += int.__repr__(value).encode('ascii')
+    elif kind is float:
+        if value != value or value in (float('inf'), float('-inf')):
+            raise ValueError("Out of range float values are not JSON compliant")
+        out += float.__repr__(value).encode('ascii')
+    elif kind is dict:
+        if depth >= _MAX_DEPTH:
+            raise _Unsupported()
+        for key in value:
+            if type(key) is not str:
+                raise _Unsupported()
+        out += b'{'
+        first = True
+        for key in sorted(value):
+            item = value[key]
+            if item is None:
+                continue
+            if not first:
+                out += b','
+            first = False
+            _emit_string(out, <str>key)
+            out += b':'
+            _emit(out, item, depth + 1)
+        out += b'}'
+    elif kind is list:
+        if depth >= _MAX_DEPTH:
+            raise _Unsupported()
+        out += b'['
+        first = True
+        for item in value:
+            if not first:
+                out += b','
+            first = False
+            _emit(out, item, depth + 1)
+        out += b']'
+    else:
+        raise _Unsupported()
+
+
+cdef _emit_string(bytearray out, str text):
+    cdef Py_ssize_t start = 0
+    cdef Py_ssize_t i
+    cdef Py_ssize_t length = len(text)
+    cdef Py_UCS4 ch
+
+    out += b'"'
+    for i in range(length):
+        ch = text[i]
+        if ch < 0x20 or ch == 0x22 or ch == 0x5C:
+            if i > start:
+                out += text[start:i].encode('utf-8')
+            escape = _ESCAPES.get(<int>ch)
+            out += escape if escape is not None else b'\\u%04x' % <int>ch
+            start = i + 1
+    if length > start:
+        out += text[start:].encode('utf-8')
+    out += b'"'
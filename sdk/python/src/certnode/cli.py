@@ -10,6 +10,7 @@ from typing import Dict, Any, List
 
 from . import verify_receipt, JWKSManager, __version__
 from .exceptions import CertNodeError
+from .utils import b64u_decode
 
 
 def main() -> None:
@@ -194,10 +195,7 @@ def inspect_receipt(receipt: Dict[str, Any], format_type: str) -> None:
 
     # Decode header to get algorithm
     try:
-        import base64
-        protected_bytes = base64.urlsafe_b64decode(
-            receipt["protected"] + "=" * (4 - len(receipt["protected"]) % 4)
-        )
+        protected_bytes = b64u_decode(receipt["protected"])
         header = json.loads(protected_bytes.decode('utf-8'))
         algorithm = header.get("alg", "unknown")
     except Exception:
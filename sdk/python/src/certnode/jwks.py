@@ -1,15 +1,116 @@
 """
 JWKS management for CertNode SDK.
+
+Keys are validated against KEYS_SCHEMA: every entry of the JWKS "keys"
+array must be an EC key on P-256 with x and y, or an OKP key on Ed25519
+with x. When fastjsonschema is installed the schema is compiled into a
+single function; a key list it rejects is re-checked by hand to report
+which key is invalid.
 """
 
-import json
 import time
-from typing import Dict, Any, List, Optional, Callable
-from urllib.request import urlopen
-from urllib.error import URLError
+from typing import Dict, Any, List, Optional, Callable, Mapping, Tuple, Union
+from urllib.request import Request, urlopen
+from urllib.error import HTTPError, URLError
+
+try:
+    import urllib3
+except ImportError:  # optional: keep-alive connection pooling
+    urllib3 = None
+
+try:
+    import fastjsonschema
+except ImportError:  # optional: compiled JWKS validation
+    fastjsonschema = None
 
 from .exceptions import JWKSError
-from .utils import jwk_thumbprint
+from .utils import json_loads, jwk_thumbprint, _thumbprint_or_none
+
+_KEY_TYPES = frozenset(("EC", "OKP"))
+
+KEYS_SCHEMA: Dict[str, Any] = {
+    "type": "array",
+    "items": {
+        "oneOf": [
+            {
+                "type": "object",
+                "required": ["kty", "crv", "x", "y"],
+                "properties": {"kty": {"const": "EC"}, "crv": {"const": "P-256"}},
+            },
+            {
+                "type": "object",
+                "required": ["kty", "crv", "x"],
+                "properties": {"kty": {"const": "OKP"}, "crv": {"const": "Ed25519"}},
+            },
+        ]
+    },
+}
+
+_validate_keys = fastjsonschema.compile(KEYS_SCHEMA) if fastjsonschema is not None else None
+
+# Shared pool so repeated JWKS refreshes reuse warm TCP/TLS connections
+_POOL = (
+    urllib3.PoolManager(maxsize=4, retries=urllib3.Retry(total=2, backoff_factor=0.1))
+    if urllib3 is not None
+    else None
+)
+
+
+# A fetcher returns the JWKS, a (jwks, etag, last_modified) tuple,
+# or None when the server answered 304 Not Modified
+FetchResult = Union[Dict[str, Any], Tuple[Dict[str, Any], Optional[str], Optional[str]], None]
+
+
+def _http_get(
+    url: str,
+    timeout: float,
+    headers: Optional[Dict[str, str]] = None
+) -> Tuple[int, bytes, Mapping[str, str]]:
+    """GET url through the shared urllib3 pool, or urlopen when unavailable."""
+    if _POOL is not None:
+        response = _POOL.request("GET", url, headers=headers, timeout=timeout)
+        return response.status, response.data, response.headers
+
+    try:
+        with urlopen(Request(url, headers=headers or {}), timeout=timeout) as response:
+            return response.status, response.read(), response.headers
+    except HTTPError as e:
+        # urllib raises for 304 and error statuses; report them like urllib3
+        return e.code, e.read(), e.headers
+
+
+def _index_jwks(jwks: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Map every identifier a receipt kid may carry to its key.
+
+    Keys are indexed by RFC 7638 thumbprint and by their kid field;
+    thumbprints take precedence, and the first key wins on collisions.
+    """
+    index: Dict[str, Dict[str, Any]] = {}
+    keys = [key for key in jwks.get("keys", []) if isinstance(key, dict)]
+    for key in keys:
+        thumbprint = _thumbprint_or_none(key)
+        if thumbprint is not None:
+            index.setdefault(thumbprint, key)
+
+    for key in keys:
+        kid = key.get("kid")
+        if isinstance(kid, str):
+            index.setdefault(kid, key)
+
+    return index
+
+
+def _keys_match_schema(keys: List[Any]) -> bool:
+    """Run the compiled KEYS_SCHEMA check; False if unavailable or rejected."""
+    if _validate_keys is None:
+        return False
+
+    try:
+        _validate_keys(keys)
+        return True
+    except fastjsonschema.JsonSchemaException:
+        return False
 
 
 class JWKSManager:
@@ -25,24 +126,36 @@ class JWKSManager:
     def __init__(
         self,
         ttl_seconds: int = 300,
-        fetcher: Optional[Callable[[str], Dict[str, Any]]] = None
+        fetcher: Optional[Callable[[str], FetchResult]] = None
     ):
         """
         Initialize JWKS manager.
 
         Args:
             ttl_seconds: Cache TTL in seconds (default: 5 minutes)
-            fetcher: Custom fetch function (url -> dict)
+            fetcher: Custom fetch function, e.g. one backed by a shared
+                requests.Session. It returns the JWKS dict, or a
+                (jwks, etag, last_modified) tuple to enable conditional
+                refreshes, or None if the server answered 304 Not Modified.
         """
         self.ttl_seconds = ttl_seconds
         self.fetcher = fetcher or self._default_fetcher
         self._cache: Optional[Dict[str, Any]] = None
         self._cache_time: float = 0
+        self._thumbprints: List[str] = []
+        self._kid_index: Dict[str, Dict[str, Any]] = {}
+        self._source_url: Optional[str] = None
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
 
     def fetch_from_url(self, url: str) -> Dict[str, Any]:
         """
         Fetch JWKS from URL with caching.
 
+        Once the TTL expires, the JWKS is revalidated with If-None-Match /
+        If-Modified-Since; a 304 response keeps the cached keys without
+        downloading or re-parsing them.
+
         Args:
             url: URL to fetch JWKS from
 
@@ -59,8 +172,23 @@ class JWKSManager:
             return self._cache
 
         try:
-            jwks = self.fetcher(url)
-            self.set_from_object(jwks)
+            result = self.fetcher(url)
+
+            if result is None:
+                # 304 Not Modified: keep the cached keys and index
+                if not self._cache or url != self._source_url:
+                    raise JWKSError("Not Modified response without a cached JWKS")
+                self._cache_time = current_time
+                return self._cache
+
+            etag = last_modified = None
+            if isinstance(result, tuple):
+                result, etag, last_modified = result
+
+            self.set_from_object(result)
+            self._source_url = url
+            self._etag = etag
+            self._last_modified = last_modified
             self._cache_time = current_time
             return self._cache
 
@@ -89,19 +217,22 @@ class JWKSManager:
         if not isinstance(jwks["keys"], list):
             raise JWKSError("JWKS 'keys' must be a list")
 
+        if _keys_match_schema(jwks["keys"]):
+            return self._accept(jwks)
+
         # Validate each key
         for i, key in enumerate(jwks["keys"]):
             if not isinstance(key, dict):
                 raise JWKSError(f"Key {i} must be a dictionary")
 
             kty = key.get("kty")
-            if kty not in ["EC", "OKP"]:
+            if not isinstance(kty, str) or kty not in _KEY_TYPES:
                 raise JWKSError(f"Key {i}: Unsupported key type '{kty}'. Use 'EC' or 'OKP'")
 
             if kty == "EC":
                 if key.get("crv") != "P-256":
                     raise JWKSError(f"Key {i}: Only P-256 curve supported for EC keys")
-                if not all(field in key for field in ["x", "y"]):
+                if "x" not in key or "y" not in key:
                     raise JWKSError(f"Key {i}: EC key missing x or y coordinate")
 
             elif kty == "OKP":
@@ -110,9 +241,36 @@ class JWKSManager:
                 if "x" not in key:
                     raise JWKSError(f"Key {i}: OKP key missing x coordinate")
 
+        return self._accept(jwks)
+
+    def _accept(self, jwks: Dict[str, Any]) -> Dict[str, Any]:
+        """Install a validated JWKS as the cache and index its keys."""
         self._cache = jwks
+        self._source_url = None  # validators only apply to fetched JWKS
+        self._build_index(jwks)
         return jwks
 
+    def _build_index(self, jwks: Dict[str, Any]) -> None:
+        """
+        Precompute key thumbprints and the kid -> key index for the JWKS.
+        """
+        thumbprints = [_thumbprint_or_none(key) for key in jwks["keys"]]
+
+        self._thumbprints = [t for t in thumbprints if t is not None]
+        self._kid_index = _index_jwks(jwks)
+
+    def lookup(self, kid: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the cached key matching a receipt kid.
+
+        Args:
+            kid: Receipt kid (RFC 7638 thumbprint or key kid field)
+
+        Returns:
+            Matching JWK, or None if no cached key matches
+        """
+        return self._kid_index.get(kid)
+
     def get_fresh(self) -> Optional[Dict[str, Any]]:
         """
         Get cached JWKS if still fresh.
@@ -148,6 +306,10 @@ class JWKSManager:
         if not jwks:
             raise JWKSError("No JWKS available")
 
+        # Thumbprints of the cached JWKS are precomputed on ingest
+        if jwks is self._cache:
+            return list(self._thumbprints)
+
         thumbprints = []
         for key in jwks.get("keys", []):
             try:
@@ -158,27 +320,42 @@ class JWKSManager:
 
         return thumbprints
 
-    def _default_fetcher(self, url: str) -> Dict[str, Any]:
+    def _default_fetcher(self, url: str) -> FetchResult:
         """
-        Default JWKS fetcher using urllib.
+        Default JWKS fetcher using urllib3 (pooled keep-alive) or urllib.
+
+        Sends the stored validators for a conditional GET when refreshing a
+        JWKS previously fetched from the same URL.
 
         Args:
             url: URL to fetch from
 
         Returns:
-            JWKS dictionary
+            (jwks, etag, last_modified) tuple, or None on 304 Not Modified
 
         Raises:
             URLError: If fetch fails
             json.JSONDecodeError: If response is not valid JSON
         """
-        try:
-            with urlopen(url, timeout=30) as response:
-                if response.status != 200:
-                    raise URLError(f"HTTP {response.status}")
+        headers = {}
+        if self._cache and url == self._source_url:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
 
-                content = response.read().decode('utf-8')
-                return json.loads(content)
+        try:
+            status, content, response_headers = _http_get(url, 30, headers)
+            if status == 304 and headers:
+                return None
+            if status != 200:
+                raise URLError(f"HTTP {status}")
+
+            return (
+                json_loads(content),
+                response_headers.get("ETag"),
+                response_headers.get("Last-Modified"),
+            )
 
         except URLError:
             raise
@@ -205,18 +382,17 @@ def fetch_jwks(url: str, timeout: int = 30) -> Dict[str, Any]:
         >>> print(f"Found {len(jwks['keys'])} keys")
     """
     try:
-        with urlopen(url, timeout=timeout) as response:
-            if response.status != 200:
-                raise JWKSError(f"HTTP {response.status} from {url}")
+        status, content, _ = _http_get(url, timeout)
+        if status != 200:
+            raise JWKSError(f"HTTP {status} from {url}")
 
-            content = response.read().decode('utf-8')
-            jwks = json.loads(content)
+        jwks = json_loads(content)
 
-            # Basic validation
-            if not isinstance(jwks, dict) or "keys" not in jwks:
-                raise JWKSError("Invalid JWKS format")
+        # Basic validation
+        if not isinstance(jwks, dict) or "keys" not in jwks:
+            raise JWKSError("Invalid JWKS format")
 
-            return jwks
+        return jwks
 
     except Exception as e:
         if isinstance(e, JWKSError):
@@ -2,10 +2,59 @@
 Utility functions for CertNode SDK.
 """
 
+import re
 import json
-import base64
+import binascii
 import hashlib
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON parsing
+    orjson = None
+
+try:
+    from ._fast import canonicalize as _fast_canonicalize
+except ImportError:  # optional: compiled canonicalizer (see _fast.pyx)
+    _fast_canonicalize = None
+
+
+# C-accelerated encoder producing the same output as _stringify_canonical
+_canonical_encoder = json.JSONEncoder(
+    sort_keys=True,
+    ensure_ascii=False,
+    separators=(',', ':'),
+    allow_nan=False,
+)
+
+_SCALAR_TYPES = (str, int, float, type(None))
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON, using orjson when installed.
+
+    Input orjson rejects but the stdlib accepts (integers beyond 64 bits,
+    NaN/Infinity literals) is re-parsed with json.loads, so results never
+    depend on whether orjson is present.
+
+    Args:
+        data: JSON text
+
+    Returns:
+        Parsed value
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(data)
 
 
 def canonicalize_json(obj: Any) -> bytes:
@@ -18,6 +67,24 @@ def canonicalize_json(obj: Any) -> bytes:
     Returns:
         Canonical JSON representation as bytes
     """
+    if _fast_canonicalize is not None:
+        canonical = _fast_canonicalize(obj)
+        if canonical is not None:
+            return canonical
+
+    # Fast path: one C encoder call. Object members with a None value must be
+    # dropped, which the C encoder cannot do, so fall back to the Python
+    # serializer whenever the output could contain one.
+    text = _canonical_encoder.encode(obj)
+    if ':null' not in text:
+        return text.encode('utf-8')
+
+    # Flat dict of scalars (the typical receipt payload): dropping the None
+    # members up front leaves nothing the C encoder renders differently
+    if isinstance(obj, dict) and all(isinstance(v, _SCALAR_TYPES) for v in obj.values()):
+        flat = {k: v for k, v in obj.items() if v is not None}
+        return _canonical_encoder.encode(flat).encode('utf-8')
+
     return _stringify_canonical(obj).encode('utf-8')
 
 
@@ -54,20 +121,44 @@ def _stringify_canonical(value: Any) -> str:
         return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
 
 
-def b64u_encode(data: bytes) -> str:
+# Translation tables between the base64url and standard base64 alphabets
+_B64U_TO_STD = bytes.maketrans(b'-_', b'+/')
+_STD_TO_B64U = bytes.maketrans(b'+/', b'-_')
+
+# Padding to restore, indexed by unpadded length & 3
+_PAD = (b'', b'===', b'==', b'=')
+
+
+def b64u_encode(data: Union[bytes, bytearray, memoryview]) -> str:
     """
     Base64url encode data.
 
     Args:
-        data: Bytes to encode
+        data: Bytes-like object to encode (memoryviews are not copied)
 
     Returns:
         Base64url encoded string
     """
-    return base64.urlsafe_b64encode(data).decode('ascii').rstrip('=')
+    return b64u_encode_bytes(data).decode('ascii')
 
 
-def b64u_decode(data: str) -> bytes:
+def b64u_encode_bytes(data: Union[bytes, bytearray, memoryview]) -> bytes:
+    """
+    Base64url encode data to ASCII bytes.
+
+    Skips the str round trip when the result is fed straight into a byte
+    buffer such as a JWS signing input.
+
+    Args:
+        data: Bytes-like object to encode
+
+    Returns:
+        Base64url encoded bytes
+    """
+    return binascii.b2a_base64(data, newline=False).translate(_STD_TO_B64U).rstrip(b'=')
+
+
+def b64u_decode(data: Union[str, bytes]) -> bytes:
     """
     Base64url decode data.
 
@@ -77,12 +168,10 @@ def b64u_decode(data: str) -> bytes:
     Returns:
         Decoded bytes
     """
-    # Add padding if needed
-    padding = 4 - (len(data) % 4)
-    if padding != 4:
-        data += '=' * padding
+    if isinstance(data, str):
+        data = data.encode('ascii')
 
-    return base64.urlsafe_b64decode(data)
+    return binascii.a2b_base64(data.translate(_B64U_TO_STD) + _PAD[len(data) & 3])
 
 
 def jwk_thumbprint(jwk: Dict[str, Any]) -> str:
@@ -98,34 +187,66 @@ def jwk_thumbprint(jwk: Dict[str, Any]) -> str:
     Raises:
         ValueError: If JWK type is not supported
     """
+    thumbprint = _thumbprint_or_none(jwk)
+    if thumbprint is not None:
+        return thumbprint
+
     if jwk.get("kty") == "EC" and jwk.get("crv") == "P-256":
-        if not all(field in jwk for field in ["x", "y"]):
-            raise ValueError("Invalid EC P-256 JWK: missing x or y")
+        raise ValueError("Invalid EC P-256 JWK: missing x or y")
+    if jwk.get("kty") == "OKP" and jwk.get("crv") == "Ed25519":
+        raise ValueError("Invalid Ed25519 JWK: missing x")
+    raise ValueError("Only EC P-256 and OKP Ed25519 JWK supported for thumbprint")
+
+
+def _thumbprint_or_none(jwk: Dict[str, Any]) -> Optional[str]:
+    """RFC 7638 thumbprint, or None for keys jwk_thumbprint would reject."""
+    kty = jwk.get("kty")
+    crv = jwk.get("crv")
+
+    if kty == "EC" and crv == "P-256":
+        if "x" not in jwk or "y" not in jwk:
+            return None
 
         # Canonical representation for EC P-256
-        canonical = {
-            "crv": jwk["crv"],
-            "kty": jwk["kty"],
-            "x": jwk["x"],
-            "y": jwk["y"]
-        }
-
-    elif jwk.get("kty") == "OKP" and jwk.get("crv") == "Ed25519":
+        x, y = jwk["x"], jwk["y"]
+        if _is_b64u(x) and _is_b64u(y):
+            canonical = f'{{"crv":"P-256","kty":"EC","x":"{x}","y":"{y}"}}'
+        else:
+            canonical = _dumps_members({"crv": "P-256", "kty": "EC", "x": x, "y": y})
+
+    elif kty == "OKP" and crv == "Ed25519":
         if "x" not in jwk:
-            raise ValueError("Invalid Ed25519 JWK: missing x")
+            return None
 
         # Canonical representation for Ed25519
-        canonical = {
-            "crv": jwk["crv"],
-            "kty": jwk["kty"],
-            "x": jwk["x"]
-        }
+        x = jwk["x"]
+        if _is_b64u(x):
+            canonical = f'{{"crv":"Ed25519","kty":"OKP","x":"{x}"}}'
+        else:
+            canonical = _dumps_members({"crv": "Ed25519", "kty": "OKP", "x": x})
 
     else:
-        raise ValueError("Only EC P-256 and OKP Ed25519 JWK supported for thumbprint")
+        return None
+
+    return _thumbprint_of(canonical)
+
+
+_B64U_VALUE = re.compile(r'[A-Za-z0-9_-]*')
+
+
+def _is_b64u(value: Any) -> bool:
+    """True if value is a base64url string, which embeds in JSON unescaped."""
+    return isinstance(value, str) and _B64U_VALUE.fullmatch(value) is not None
+
+
+def _dumps_members(members: Dict[str, Any]) -> str:
+    """Serialize thumbprint members that need general JSON encoding."""
+    return json.dumps(members, separators=(',', ':'), sort_keys=True)
+
 
-    # Create canonical JSON and hash
-    canonical_json = json.dumps(canonical, separators=(',', ':'), sort_keys=True)
-    hash_bytes = hashlib.sha256(canonical_json.encode('utf-8')).digest()
+@lru_cache(maxsize=256)
+def _thumbprint_of(canonical: str) -> str:
+    """Hash the canonical JWK members; memoized since JWKS keys rarely change."""
+    hash_bytes = hashlib.sha256(canonical.encode('utf-8')).digest()
 
     return b64u_encode(hash_bytes)
\ No newline at end of file
@@ -2,23 +2,26 @@
 CertNode receipt verification implementation.
 """
 
-import json
+import os
 import base64
 import hashlib
-from typing import Dict, Any, Union, Optional
-from dataclasses import dataclass
+from typing import Dict, Any, Callable, List, NamedTuple, Union, Optional
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ec, ed25519
 from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature, decode_dss_signature
 from cryptography.exceptions import InvalidSignature
 
-from .exceptions import VerificationError
-from .utils import canonicalize_json, b64u_decode, b64u_encode, jwk_thumbprint
+from .exceptions import VerificationError, JWKSError
+from .jwks import JWKSManager, _index_jwks
+from .utils import canonicalize_json, b64u_decode, b64u_encode, b64u_encode_bytes, json_loads
 
+_RECEIPT_REQUIRED = ("protected", "signature", "payload", "kid")
 
-@dataclass
-class VerifyResult:
+
+class VerifyResult(NamedTuple):
     """Result of receipt verification."""
     ok: bool
     reason: Optional[str] = None
@@ -26,14 +29,15 @@ class VerifyResult:
 
 def verify_receipt(
     receipt: Union[Dict[str, Any], str],
-    jwks: Dict[str, Any]
+    jwks: Union[Dict[str, Any], JWKSManager]
 ) -> VerifyResult:
     """
     Verify a CertNode receipt using a JWKS object.
 
     Args:
         receipt: The receipt to verify (dict or JSON string)
-        jwks: The JWKS containing public keys
+        jwks: The JWKS containing public keys, or a JWKSManager holding one
+            (uses its precomputed key index instead of scanning the keys)
 
     Returns:
         VerifyResult with ok=True if valid, ok=False with reason if invalid
@@ -53,51 +57,44 @@ def verify_receipt(
     try:
         # Parse receipt if string
         if isinstance(receipt, str):
-            receipt = json.loads(receipt)
+            receipt = json_loads(receipt)
 
         # Validate receipt structure
-        required_fields = ["protected", "signature", "payload", "kid"]
-        for field in required_fields:
-            if field not in receipt:
-                return VerifyResult(False, f"Missing required field: {field}")
+        missing = [field for field in _RECEIPT_REQUIRED if field not in receipt]
+        if missing:
+            return VerifyResult(False, f"Missing required field: {missing[0]}")
 
         # Decode protected header
         try:
             protected_bytes = b64u_decode(receipt["protected"])
-            header = json.loads(protected_bytes.decode('utf-8'))
+            header = json_loads(protected_bytes.decode('utf-8'))
         except Exception as e:
             return VerifyResult(False, f"Invalid protected header: {e}")
 
         # Validate algorithm
         algorithm = header.get("alg")
-        if algorithm not in ["ES256", "EdDSA"]:
+        verifier = _VERIFIERS.get(algorithm) if isinstance(algorithm, str) else None
+        if verifier is None:
             return VerifyResult(False, f"Unsupported algorithm: {algorithm}. Use ES256 or EdDSA.")
 
         # Validate kid consistency
         if header.get("kid") != receipt["kid"]:
             return VerifyResult(False, "Kid mismatch between header and receipt")
 
-        # Find matching key in JWKS
-        key = None
-        for k in jwks.get("keys", []):
-            try:
-                # Try matching by RFC7638 thumbprint
-                thumbprint = jwk_thumbprint(k)
-                if thumbprint == receipt["kid"]:
-                    key = k
-                    break
-            except Exception:
-                # Try matching by kid field
-                if k.get("kid") == receipt["kid"]:
-                    key = k
-                    break
+        # Find matching key in JWKS (by RFC7638 thumbprint, then kid field)
+        if isinstance(jwks, JWKSManager):
+            key = jwks.lookup(receipt["kid"])
+        else:
+            key = _index_jwks(jwks).get(receipt["kid"])
 
         if not key:
             return VerifyResult(False, f"Key not found in JWKS: {receipt['kid']}")
 
+        # Canonicalize once for both the JCS hash check and the signing input
+        jcs_bytes = canonicalize_json(receipt["payload"])
+
         # Validate JCS hash if present
         if "payload_jcs_sha256" in receipt:
-            jcs_bytes = canonicalize_json(receipt["payload"])
             jcs_hash = hashlib.sha256(jcs_bytes).digest()
             expected_hash = b64u_decode(receipt["payload_jcs_sha256"])
 
@@ -105,20 +102,12 @@ def verify_receipt(
                 return VerifyResult(False, "JCS hash mismatch")
 
         # Create signing input (protected + '.' + JCS(payload))
-        payload_b64u = b64u_encode(canonicalize_json(receipt["payload"]))
-        signing_input = f"{receipt['protected']}.{payload_b64u}"
-        signing_data = signing_input.encode('utf-8')
+        signing_data = b'.'.join((receipt["protected"].encode('utf-8'), b64u_encode_bytes(jcs_bytes)))
 
         # Verify signature based on algorithm
         try:
             signature_bytes = b64u_decode(receipt["signature"])
-
-            if algorithm == "ES256":
-                is_valid = _verify_es256(key, signing_data, signature_bytes)
-            elif algorithm == "EdDSA":
-                is_valid = _verify_eddsa(key, signing_data, signature_bytes)
-            else:
-                return VerifyResult(False, f"Unsupported algorithm: {algorithm}")
+            is_valid = verifier(key, signing_data, signature_bytes)
 
         except Exception as e:
             return VerifyResult(False, f"Signature verification failed: {e}")
@@ -128,9 +117,11 @@ def verify_receipt(
 
         # Optional receipt_id check if present
         if "receipt_id" in receipt:
-            full_receipt = f"{receipt['protected']}.{payload_b64u}.{receipt['signature']}"
-            computed_hash = hashlib.sha256(full_receipt.encode('utf-8')).digest()
-            computed_id = b64u_encode(computed_hash)
+            # Hash protected.payload.signature without building the joined string
+            h = hashlib.sha256(signing_data)
+            h.update(b'.')
+            h.update(receipt["signature"].encode('utf-8'))
+            computed_id = b64u_encode(h.digest())
 
             if computed_id != receipt["receipt_id"]:
                 return VerifyResult(False, "Receipt ID mismatch")
@@ -141,28 +132,98 @@ def verify_receipt(
         return VerifyResult(False, f"Verification failed: {e}")
 
 
+def verify_receipts(
+    receipts: List[Union[Dict[str, Any], str]],
+    jwks: Union[Dict[str, Any], JWKSManager],
+    max_workers: Optional[int] = None
+) -> List[VerifyResult]:
+    """
+    Verify many CertNode receipts against the same JWKS concurrently.
+
+    The JWKS is indexed once for the whole batch, and receipts are verified
+    on a thread pool: the signature checks run in OpenSSL and the public key
+    objects are shared through the key cache, so bulk audits scale across
+    cores. Each worker takes one contiguous slice of the batch, so there is
+    one task per thread rather than per receipt.
+
+    SHA-256 goes through hashlib's OpenSSL backend, which uses SHA-NI / ARMv8
+    crypto extensions when the CPU has them and releases the GIL for inputs
+    over 2 KiB, so large payloads hash in parallel without extra code.
+
+    Args:
+        receipts: Receipts to verify (dicts or JSON strings)
+        jwks: The JWKS containing public keys, or a JWKSManager holding one
+        max_workers: Thread count (default: os.cpu_count())
+
+    Returns:
+        One VerifyResult per receipt, in input order
+
+    Example:
+        >>> results = verify_receipts(receipts, jwks)
+        >>> print(sum(r.ok for r in results), "valid")
+    """
+    if not isinstance(jwks, JWKSManager):
+        # Index the JWKS once instead of scanning it for every receipt
+        manager = JWKSManager()
+        try:
+            manager.set_from_object(jwks)
+            jwks = manager
+        except JWKSError:
+            pass
+
+    workers = min(max_workers or os.cpu_count() or 1, len(receipts))
+    if workers <= 1:
+        return [verify_receipt(receipt, jwks) for receipt in receipts]
+
+    size = -(-len(receipts) // workers)
+    chunks = [receipts[i:i + size] for i in range(0, len(receipts), size)]
+
+    def verify_chunk(chunk: List[Union[Dict[str, Any], str]]) -> List[VerifyResult]:
+        return [verify_receipt(receipt, jwks) for receipt in chunk]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return [result for chunk in executor.map(verify_chunk, chunks) for result in chunk]
+
+
+@lru_cache(maxsize=128)
+def _load_es256_key(x_b64u: str, y_b64u: str) -> ec.EllipticCurvePublicKey:
+    """Construct (and memoize) a P-256 public key from JWK coordinates."""
+    x_bytes = b64u_decode(x_b64u)
+    y_bytes = b64u_decode(y_b64u)
+
+    if len(x_bytes) != 32 or len(y_bytes) != 32:
+        raise VerificationError("Invalid coordinate length for P-256")
+
+    # Create uncompressed point (0x04 + x + y)
+    uncompressed_point = b'\x04' + x_bytes + y_bytes
+
+    return ec.EllipticCurvePublicKey.from_encoded_point(
+        ec.SECP256R1(), uncompressed_point
+    )
+
+
+@lru_cache(maxsize=128)
+def _load_eddsa_key(x_b64u: str) -> ed25519.Ed25519PublicKey:
+    """Construct (and memoize) an Ed25519 public key from its JWK x value."""
+    public_key_bytes = b64u_decode(x_b64u)
+
+    if len(public_key_bytes) != 32:
+        raise VerificationError("Invalid public key length for Ed25519")
+
+    return ed25519.Ed25519PublicKey.from_public_bytes(public_key_bytes)
+
+
 def _verify_es256(jwk: Dict[str, Any], signing_data: bytes, signature_bytes: bytes) -> bool:
     """Verify ES256 signature using ECDSA P-256."""
     if jwk.get("kty") != "EC" or jwk.get("crv") != "P-256":
         raise VerificationError("ES256 requires EC P-256 key")
 
-    if not all(field in jwk for field in ["x", "y"]):
+    if "x" not in jwk or "y" not in jwk:
         raise VerificationError("Invalid P-256 JWK: missing x or y coordinate")
 
     # Convert JWK to public key
     try:
-        x_bytes = b64u_decode(jwk["x"])
-        y_bytes = b64u_decode(jwk["y"])
-
-        if len(x_bytes) != 32 or len(y_bytes) != 32:
-            raise VerificationError("Invalid coordinate length for P-256")
-
-        # Create uncompressed point (0x04 + x + y)
-        uncompressed_point = b'\x04' + x_bytes + y_bytes
-
-        public_key = ec.EllipticCurvePublicKey.from_encoded_point(
-            ec.SECP256R1(), uncompressed_point
-        )
+        public_key = _load_es256_key(jwk["x"], jwk["y"])
 
     except Exception as e:
         raise VerificationError(f"Failed to construct P-256 public key: {e}")
@@ -199,12 +260,7 @@ def _verify_eddsa(jwk: Dict[str, Any], signing_data: bytes, signature_bytes: byt
 
     # Convert JWK to public key
     try:
-        public_key_bytes = b64u_decode(jwk["x"])
-
-        if len(public_key_bytes) != 32:
-            raise VerificationError("Invalid public key length for Ed25519")
-
-        public_key = ed25519.Ed25519PublicKey.from_public_bytes(public_key_bytes)
+        public_key = _load_eddsa_key(jwk["x"])
 
     except Exception as e:
         raise VerificationError(f"Failed to construct Ed25519 public key: {e}")
@@ -217,4 +273,11 @@ def _verify_eddsa(jwk: Dict[str, Any], signing_data: bytes, signature_bytes: byt
     except InvalidSignature:
         return False
     except Exception as e:
-        raise VerificationError(f"EdDSA verification failed: {e}")
\ No newline at end of file
+        raise VerificationError(f"EdDSA verification failed: {e}")
+
+
+# Signature verifiers by JWS "alg"
+_VERIFIERS: Dict[str, Callable[[Dict[str, Any], bytes, bytes], bool]] = {
+    "ES256": _verify_es256,
+    "EdDSA": _verify_eddsa,
+}
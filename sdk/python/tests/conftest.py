@@ -0,0 +1,73 @@
+"""Shared fixtures: freshly signed CertNode receipts and their JWKS."""
+
+import hashlib
+import json
+
+import pytest
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+
+from certnode.utils import b64u_encode, canonicalize_json, jwk_thumbprint
+
+
+def _generate_key(alg):
+    """(private key, public JWK) for alg."""
+    if alg == "ES256":
+        private_key = ec.generate_private_key(ec.SECP256R1())
+        numbers = private_key.public_key().public_numbers()
+        return private_key, {
+            "kty": "EC",
+            "crv": "P-256",
+            "x": b64u_encode(numbers.x.to_bytes(32, "big")),
+            "y": b64u_encode(numbers.y.to_bytes(32, "big")),
+        }
+
+    private_key = ed25519.Ed25519PrivateKey.generate()
+    raw = private_key.public_key().public_bytes(
+        serialization.Encoding.Raw, serialization.PublicFormat.Raw
+    )
+    return private_key, {"kty": "OKP", "crv": "Ed25519", "x": b64u_encode(raw)}
+
+
+def _sign(alg, private_key, signing_input):
+    if alg == "ES256":
+        r, s = decode_dss_signature(private_key.sign(signing_input, ec.ECDSA(hashes.SHA256())))
+        return r.to_bytes(32, "big") + s.to_bytes(32, "big")
+    return private_key.sign(signing_input)
+
+
+@pytest.fixture
+def make_receipt():
+    """
+    Build a signed receipt: make_receipt(payload, alg="ES256", kid=None).
+
+    The receipt kid is the key's RFC 7638 thumbprint unless kid is given, in
+    which case it is also set as the JWK's kid field. Returns (receipt, jwks).
+    """
+
+    def make(payload, alg="ES256", kid=None):
+        private_key, jwk = _generate_key(alg)
+        if kid is None:
+            kid = jwk_thumbprint(jwk)
+        else:
+            jwk["kid"] = kid
+
+        protected = b64u_encode(json.dumps({"alg": alg, "kid": kid}).encode("utf-8"))
+        jcs = canonicalize_json(payload)
+        signing_input = f"{protected}.{b64u_encode(jcs)}".encode("ascii")
+        signature = b64u_encode(_sign(alg, private_key, signing_input))
+
+        receipt = {
+            "protected": protected,
+            "payload": payload,
+            "signature": signature,
+            "kid": kid,
+            "payload_jcs_sha256": b64u_encode(hashlib.sha256(jcs).digest()),
+            "receipt_id": b64u_encode(
+                hashlib.sha256(signing_input + b"." + signature.encode("ascii")).digest()
+            ),
+        }
+        return receipt, {"keys": [jwk]}
+
+    return make
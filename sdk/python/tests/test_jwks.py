@@ -0,0 +1,118 @@
+"""Tests for JWKS indexing and fetching."""
+
+import pytest
+
+import certnode.jwks
+from certnode import JWKSError, JWKSManager, verify_receipt
+from certnode.jwks import _index_jwks
+from certnode.utils import jwk_thumbprint
+
+EC_KEY = {
+    "kty": "EC",
+    "crv": "P-256",
+    "x": "f83OJ3D2xF1Bg8vub9tLe1gHMzV76e8Tus9uPHvRVEU",
+    "y": "x_FEzRu9m36HLN_tue659LNpXW6pCyStikYjKIWI5a0",
+}
+OKP_KEY = {"kty": "OKP", "crv": "Ed25519", "x": "11qYAYKxCrfVS_7TyWQHOg7hcvPapiMlrwIaaPcHURo"}
+
+
+class TestIndex:
+    def test_indexes_by_thumbprint_and_kid(self):
+        ec_key = dict(EC_KEY, kid="ec-1")
+        index = _index_jwks({"keys": [ec_key, OKP_KEY]})
+
+        assert index[jwk_thumbprint(EC_KEY)] is ec_key
+        assert index["ec-1"] is ec_key
+        assert index[jwk_thumbprint(OKP_KEY)] is OKP_KEY
+
+    def test_thumbprint_wins_over_kid_field(self):
+        okp_thumbprint = jwk_thumbprint(OKP_KEY)
+        impostor = dict(EC_KEY, kid=okp_thumbprint)
+
+        index = _index_jwks({"keys": [impostor, OKP_KEY]})
+
+        assert index[okp_thumbprint] is OKP_KEY
+
+    def test_first_key_wins_on_kid_collision(self):
+        first, second = dict(EC_KEY, kid="same"), dict(OKP_KEY, kid="same")
+
+        assert _index_jwks({"keys": [first, second]})["same"] is first
+
+    def test_skips_malformed_entries(self):
+        index = _index_jwks({"keys": ["junk", {"kty": "RSA", "kid": ["list"]}, dict(OKP_KEY, kid=7)]})
+
+        assert list(index) == [jwk_thumbprint(OKP_KEY)]
+
+    def test_manager_lookup(self):
+        manager = JWKSManager()
+        manager.set_from_object({"keys": [dict(EC_KEY, kid="ec-1"), OKP_KEY]})
+
+        assert manager.lookup("ec-1")["x"] == EC_KEY["x"]
+        assert manager.lookup(jwk_thumbprint(OKP_KEY)) is not None
+        assert manager.lookup("missing") is None
+        assert manager.thumbprints() == [jwk_thumbprint(EC_KEY), jwk_thumbprint(OKP_KEY)]
+
+    @pytest.mark.parametrize("alg", ["ES256", "EdDSA"])
+    def test_receipt_found_by_kid_field(self, make_receipt, alg):
+        receipt, jwks = make_receipt({"doc": 1}, alg, kid="signing-key-2024")
+        manager = JWKSManager()
+        manager.set_from_object(jwks)
+
+        assert verify_receipt(receipt, jwks).ok
+        assert verify_receipt(receipt, manager).ok
+
+
+JWKS_URL = "https://certnode.test/.well-known/jwks.json"
+
+
+class TestConditionalFetch:
+    def test_not_modified_keeps_cached_jwks(self):
+        responses = [({"keys": [OKP_KEY]}, '"v1"', None), None]
+        manager = JWKSManager(ttl_seconds=0, fetcher=lambda url: responses.pop(0))
+
+        first = manager.fetch_from_url(JWKS_URL)
+        second = manager.fetch_from_url(JWKS_URL)
+
+        assert second is first
+        assert manager.lookup(jwk_thumbprint(OKP_KEY)) is not None
+
+    def test_not_modified_without_cache_fails(self):
+        manager = JWKSManager(fetcher=lambda url: None)
+
+        with pytest.raises(JWKSError):
+            manager.fetch_from_url(JWKS_URL)
+
+    def test_not_modified_for_other_url_fails(self):
+        responses = [({"keys": [OKP_KEY]}, '"v1"', None), None]
+        manager = JWKSManager(ttl_seconds=0, fetcher=lambda url: responses.pop(0))
+        manager.fetch_from_url(JWKS_URL)
+
+        with pytest.raises(JWKSError):
+            manager.fetch_from_url(JWKS_URL + "?other")
+
+    def test_default_fetcher_sends_validators(self, monkeypatch):
+        sent = []
+        replies = [
+            (200, b'{"keys": []}', {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+            (304, b"", {}),
+        ]
+
+        def fake_get(url, timeout, headers=None):
+            sent.append(headers)
+            return replies.pop(0)
+
+        monkeypatch.setattr(certnode.jwks, "_http_get", fake_get)
+        manager = JWKSManager(ttl_seconds=0)
+
+        first = manager.fetch_from_url(JWKS_URL)
+        assert manager.fetch_from_url(JWKS_URL) is first
+        assert sent == [
+            {},
+            {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"},
+        ]
+
+    def test_unconditional_304_is_an_error(self, monkeypatch):
+        monkeypatch.setattr(certnode.jwks, "_http_get", lambda url, timeout, headers=None: (304, b"", {}))
+
+        with pytest.raises(JWKSError):
+            JWKSManager().fetch_from_url(JWKS_URL)
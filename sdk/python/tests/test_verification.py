@@ -0,0 +1,87 @@
+"""Tests for receipt verification."""
+
+import json
+
+import pytest
+
+from certnode import JWKSManager, VerifyResult, verify_receipt, verify_receipts
+
+
+@pytest.mark.parametrize("alg", ["ES256", "EdDSA"])
+class TestVerifyReceipt:
+    def test_valid_receipt(self, make_receipt, alg):
+        receipt, jwks = make_receipt({"document": "Hello", "n": [1, None, {"é": 2}]}, alg)
+
+        assert verify_receipt(receipt, jwks) == VerifyResult(True)
+        assert verify_receipt(json.dumps(receipt), jwks).ok
+
+    def test_tampered_payload(self, make_receipt, alg):
+        receipt, jwks = make_receipt({"amount": 1}, alg)
+        receipt["payload"] = {"amount": 2}
+
+        assert verify_receipt(receipt, jwks) == VerifyResult(False, "JCS hash mismatch")
+
+    def test_receipt_id_mismatch(self, make_receipt, alg):
+        receipt, jwks = make_receipt({"amount": 1}, alg)
+        receipt["receipt_id"] = "not-the-id"
+
+        assert verify_receipt(receipt, jwks) == VerifyResult(False, "Receipt ID mismatch")
+
+    def test_unknown_key(self, make_receipt, alg):
+        receipt, _ = make_receipt({"amount": 1}, alg)
+
+        result = verify_receipt(receipt, {"keys": []})
+        assert not result.ok
+        assert result.reason.startswith("Key not found")
+
+
+class TestVerifyReceipts:
+    @staticmethod
+    def _batch(make_receipt, count):
+        """count receipts under one JWKS, every third one tampered."""
+        receipts, keys = [], []
+        for i in range(count):
+            receipt, jwks = make_receipt({"i": i}, "ES256" if i % 2 else "EdDSA")
+            if i % 3 == 0:
+                receipt["payload"] = {"i": i, "tampered": True}
+            receipts.append(receipt)
+            keys += jwks["keys"]
+        expected = [i % 3 != 0 for i in range(count)]
+        return receipts, {"keys": keys}, expected
+
+    @pytest.mark.parametrize("max_workers", [2, 3, 8])
+    def test_results_in_input_order_across_slices(self, make_receipt, max_workers):
+        receipts, jwks, expected = self._batch(make_receipt, 25)
+
+        results = verify_receipts(receipts, jwks, max_workers=max_workers)
+
+        assert [result.ok for result in results] == expected
+
+    def test_single_worker_path(self, make_receipt):
+        receipts, jwks, expected = self._batch(make_receipt, 7)
+
+        assert [r.ok for r in verify_receipts(receipts, jwks, max_workers=1)] == expected
+        assert [r.ok for r in verify_receipts(receipts[:1], jwks)] == expected[:1]
+
+    def test_empty_batch(self, make_receipt):
+        _, jwks = make_receipt({"i": 0})
+
+        assert verify_receipts([], jwks) == []
+
+    def test_matches_verify_receipt_with_manager(self, make_receipt):
+        receipts, jwks, expected = self._batch(make_receipt, 6)
+        manager = JWKSManager()
+        manager.set_from_object(jwks)
+
+        assert verify_receipts(receipts, manager, max_workers=2) == [
+            verify_receipt(receipt, jwks) for receipt in receipts
+        ]
+
+    def test_jwks_rejected_by_manager_falls_back_to_dict(self, make_receipt):
+        receipts, jwks, expected = self._batch(make_receipt, 6)
+        # set_from_object refuses RSA keys, so the raw JWKS is used instead
+        jwks["keys"].append({"kty": "RSA", "n": "AQAB", "e": "AQAB"})
+
+        results = verify_receipts(receipts, jwks, max_workers=2)
+
+        assert [result.ok for result in results] == expected
@@ -10,10 +10,56 @@ import json
 import os
 import sys
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any
 import argparse
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+VECTOR_REQUIRED = ("description", "receipt", "jwks", "expected_result", "metadata")
+RECEIPT_REQUIRED = ("protected", "payload", "signature", "kid")
+
+# Below this many files, process start-up costs more than it saves
+PARALLEL_MIN_FILES = 64
+
+def _validate_one(vector_path: Path) -> Dict[str, Any]:
+    """Validate a single test vector file (module level so worker processes can pickle it)."""
+    try:
+        with open(vector_path, "rb") as f:
+            content = f.read()
+
+        try:
+            data = orjson.loads(content) if orjson else json.loads(content)
+        except ValueError:
+            # orjson rejects some input json accepts (e.g. huge integers)
+            data = json.loads(content)
+
+        for field in VECTOR_REQUIRED:
+            if field not in data:
+                return {"valid": False, "error": f"Missing required field: {field}"}
+
+        # Validate receipt structure
+        receipt = data["receipt"]
+        for field in RECEIPT_REQUIRED:
+            if field not in receipt:
+                return {"valid": False, "error": f"Receipt missing field: {field}"}
+
+        # Validate JWKS structure
+        jwks = data["jwks"]
+        if "keys" not in jwks or not isinstance(jwks["keys"], list):
+            return {"valid": False, "error": "JWKS must have keys array"}
+
+        return {"valid": True}
+
+    except json.JSONDecodeError as e:
+        return {"valid": False, "error": f"Invalid JSON: {e}"}
+    except Exception as e:
+        return {"valid": False, "error": f"Validation error: {e}"}
+
 class TestRunner:
     """Runs test vectors against different SDK implementations."""
 
@@ -85,33 +131,7 @@ class TestRunner:
 
     def validate_test_vector(self, vector_path: Path) -> Dict[str, Any]:
         """Validate a single test vector file."""
-        try:
-            with open(vector_path) as f:
-                data = json.load(f)
-
-            required_fields = ["description", "receipt", "jwks", "expected_result", "metadata"]
-            for field in required_fields:
-                if field not in data:
-                    return {"valid": False, "error": f"Missing required field: {field}"}
-
-            # Validate receipt structure
-            receipt = data["receipt"]
-            receipt_fields = ["protected", "payload", "signature", "kid"]
-            for field in receipt_fields:
-                if field not in receipt:
-                    return {"valid": False, "error": f"Receipt missing field: {field}"}
-
-            # Validate JWKS structure
-            jwks = data["jwks"]
-            if "keys" not in jwks or not isinstance(jwks["keys"], list):
-                return {"valid": False, "error": "JWKS must have keys array"}
-
-            return {"valid": True}
-
-        except json.JSONDecodeError as e:
-            return {"valid": False, "error": f"Invalid JSON: {e}"}
-        except Exception as e:
-            return {"valid": False, "error": f"Validation error: {e}"}
+        return _validate_one(vector_path)
 
     def run_all_tests(self) -> Dict[str, Any]:
         """Run tests against all available SDKs."""
@@ -122,12 +142,18 @@ class TestRunner:
         print("\n📋 Validating test vector files...")
         vectors = self.load_test_vectors()
 
-        validation_errors = []
-        for category, files in vectors.items():
-            for vector_file in files:
-                result = self.validate_test_vector(vector_file)
-                if not result["valid"]:
-                    validation_errors.append(f"{vector_file.name}: {result['error']}")
+        all_files = [f for files in vectors.values() for f in files]
+        if len(all_files) >= PARALLEL_MIN_FILES:
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(_validate_one, all_files, chunksize=16))
+        else:
+            results = [_validate_one(f) for f in all_files]
+
+        validation_errors = [
+            f"{vector_file.name}: {result['error']}"
+            for vector_file, result in zip(all_files, results)
+            if not result["valid"]
+        ]
 
         if validation_errors:
             print("❌ Test vector validation errors:")
@@ -7,6 +7,7 @@ perplexity analysis and model fingerprinting.
 """
 
 from .client import CertNodeClient, CertNodeError
+from .async_client import AsyncCertNodeClient
 from .types import (
     ContentCertificationRequest,
     AIDetectionResult,
@@ -19,6 +20,7 @@ from .types import (
 __version__ = "2.0.0"
 __all__ = [
     "CertNodeClient",
+    "AsyncCertNodeClient",
     "CertNodeError",
     "ContentCertificationRequest",
     "AIDetectionResult",
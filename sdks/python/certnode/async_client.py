@@ -0,0 +1,270 @@
+"""CertNode Python SDK asyncio client implementation."""
+
+import asyncio
+import random
+from typing import Dict, List, Mapping, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:  # optional: pip install certnode-python[async]
+    httpx = None
+
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+from .client import (
+    MAX_BATCH_ITEMS,
+    CertNodeError,
+    _RateLimitPacer,
+    _ResponseCache,
+    _batch_items,
+    _batch_results,
+    _cache_policy,
+    _content_payload,
+    _dumps,
+    _error_data,
+    _loads,
+    _rate_limit_info,
+    _retry_delay,
+)
+from .types import (
+    ContentCertificationRequest,
+    CertificationResponse,
+    VerificationResponse,
+    UsageStats,
+)
+
+
+class AsyncCertNodeClient:
+    """
+    Asyncio client for the CertNode Content Authenticity API.
+
+    Mirrors CertNodeClient with coroutine methods on a pooled httpx
+    AsyncClient (HTTP/2 when the h2 package is installed). Use it as an
+    async context manager, or await aclose() when done.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://certnode.io/api/v1",
+        timeout: int = 30,
+        retries: int = 3,
+        backoff_base: float = 0.1,
+        backoff_cap: float = 10.0,
+        verify_cache_size: int = 1024,
+        adaptive_rate_limit: bool = True,
+    ):
+        """
+        Initialize the async CertNode client.
+
+        Args:
+            api_key: Your CertNode API key
+            base_url: API base URL (default: https://certnode.io/api/v1)
+            timeout: Request timeout in seconds (default: 30)
+            retries: Number of retry attempts for rate limiting (default: 3)
+            backoff_base: Minimum rate-limit backoff in seconds (default: 0.1)
+            backoff_cap: Maximum rate-limit backoff in seconds (default: 10)
+            verify_cache_size: Verification responses kept in memory, 0 to
+                disable (default: 1024)
+            adaptive_rate_limit: Pace requests from X-RateLimit-* headers
+                when the remaining budget runs low (default: True)
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncCertNodeClient requires httpx: pip install certnode-python[async]"
+            )
+
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self._rand = random.Random()
+        self._verify_cache = _ResponseCache(verify_cache_size)
+        self._pacer = _RateLimitPacer() if adaptive_rate_limit else None
+
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=timeout,
+            headers={
+                "X-API-Key": self.api_key,
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                "User-Agent": "certnode-python/2.0.0 (Python; asyncio)",
+            },
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncCertNodeClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def certify_content(
+        self, request: ContentCertificationRequest
+    ) -> CertificationResponse:
+        """Certify content and receive AI detection analysis."""
+        payload = _content_payload(request)
+        return (await self._request("POST", "/receipts/content", payload))[0]
+
+    async def verify_content(self, receipt_id: str) -> VerificationResponse:
+        """Verify a content receipt (cached per receipt ID, like CertNodeClient)."""
+        cached = self._verify_cache.get(receipt_id)
+        if cached is not None:
+            return cached
+
+        result, headers = await self._request("GET", f"/verify/content/{receipt_id}")
+        cacheable, max_age = _cache_policy(headers)
+        if cacheable:
+            self._verify_cache.put(receipt_id, result, max_age)
+        return result
+
+    def clear_verify_cache(self) -> None:
+        """Drop all cached verification responses."""
+        self._verify_cache.clear()
+
+    async def certify_batch(
+        self, requests_list: List[ContentCertificationRequest]
+    ) -> List[CertificationResponse]:
+        """
+        Batch certify up to MAX_BATCH_ITEMS content items in one request.
+
+        Duplicates are sent once and share one result dict, as in
+        CertNodeClient.certify_batch.
+        """
+        if len(requests_list) > MAX_BATCH_ITEMS:
+            raise CertNodeError(
+                f"Batch size cannot exceed {MAX_BATCH_ITEMS} items",
+                status_code=400,
+                error_code="BATCH_SIZE_EXCEEDED",
+            )
+
+        items, slots = _batch_items(requests_list)
+        response, _ = await self._request("POST", "/receipts/content/batch", {"items": items})
+        return _batch_results(response, items, slots)
+
+    async def certify_many(
+        self, requests_list: List[ContentCertificationRequest], concurrency: int = 8
+    ) -> List[CertificationResponse]:
+        """
+        Certify any number of content items, in concurrent batches.
+
+        Args:
+            requests_list: List of content certification requests
+            concurrency: Maximum number of batches in flight (default: 8)
+
+        Returns:
+            List of CertificationResponse objects, in the order of requests_list
+
+        Raises:
+            CertNodeError: If any batch request fails
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def certify(chunk: List[ContentCertificationRequest]) -> List[CertificationResponse]:
+            async with semaphore:
+                return await self.certify_batch(chunk)
+
+        batches = await asyncio.gather(*(
+            certify(requests_list[i:i + MAX_BATCH_ITEMS])
+            for i in range(0, len(requests_list), MAX_BATCH_ITEMS)
+        ))
+        return [result for batch in batches for result in batch]
+
+    async def get_usage_stats(self) -> UsageStats:
+        """Get API usage statistics."""
+        return (await self._request("GET", "/usage"))[0]
+
+    async def gather_verify(
+        self, receipt_ids: List[str], concurrency: int = 16
+    ) -> List[VerificationResponse]:
+        """
+        Verify many receipts concurrently.
+
+        Args:
+            receipt_ids: Receipt IDs to verify
+            concurrency: Maximum number of requests in flight (default: 16)
+
+        Returns:
+            VerificationResponse objects, in the order of receipt_ids
+
+        Raises:
+            CertNodeError: If any verification request fails
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def verify(receipt_id: str) -> VerificationResponse:
+            async with semaphore:
+                return await self.verify_content(receipt_id)
+
+        return list(await asyncio.gather(*(verify(rid) for rid in receipt_ids)))
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+    ) -> Tuple[Dict, Mapping[str, str]]:
+        """Make an HTTP request with retry logic; returns (parsed body, headers)."""
+        if method not in ("GET", "POST"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        try:
+            body = _dumps(data) if data is not None else None
+        except ValueError as e:
+            raise CertNodeError(f"Network error: {str(e)}", error_code="NETWORK_ERROR")
+
+        delay = self.backoff_base
+        backed_off = False
+        for attempt in range(self.retries + 1):
+            # Right after a 429 backoff the wait for this window is already paid
+            if self._pacer is not None and not backed_off:
+                pause = self._pacer.delay(self.backoff_cap)
+                if pause:
+                    await asyncio.sleep(pause)
+            backed_off = False
+
+            try:
+                response = await self.client.request(method, endpoint, content=body)
+            except httpx.HTTPError as e:
+                raise CertNodeError(f"Network error: {str(e)}", error_code="NETWORK_ERROR")
+
+            rate_limit_info = _rate_limit_info(response.headers)
+            if self._pacer is not None:
+                self._pacer.observe(rate_limit_info)
+
+            # Handle rate limiting
+            if response.status_code == 429 and attempt < self.retries:
+                delay = _retry_delay(
+                    rate_limit_info, self._rand, self.backoff_base, self.backoff_cap, delay
+                )
+                await asyncio.sleep(delay)
+                backed_off = True
+                continue
+
+            # Handle other errors
+            if response.status_code >= 400:
+                error_data = _error_data(response.headers, response.content)
+                raise CertNodeError(
+                    error_data.get("error", "API request failed"),
+                    status_code=response.status_code,
+                    error_code=error_data.get("code", "UNKNOWN_ERROR"),
+                    rate_limit_info=rate_limit_info,
+                )
+
+            # Same error as CertNodeClient for an unparseable success body
+            try:
+                return _loads(response.content), response.headers
+            except ValueError as e:
+                raise CertNodeError(f"Network error: {str(e)}", error_code="NETWORK_ERROR")
@@ -1,12 +1,36 @@
 """CertNode Python SDK client implementation."""
 
 import base64
+import json
+import random
+import threading
 import time
-from typing import Dict, List, Optional, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 import requests
 from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.exceptions import MaxRetryError
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:  # optional: pip install certnode-python[fast]
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional: pip install certnode-python[msgspec]
+    msgspec = None
+
+try:
+    import httpx
+    import h2  # noqa: F401
+except ImportError:  # optional: pip install certnode-python[http2]
+    httpx = None
+
 from .types import (
     ContentCertificationRequest,
     CertificationResponse,
@@ -15,6 +39,319 @@ from .types import (
     UsageStats,
 )
 
+_b64encode = base64.b64encode
+
+_DEFAULT_UA = "certnode-python/2.0.0 (Python)"
+
+# Largest content the API accepts (images; see Content Size Limits)
+MAX_CONTENT_BYTES = 10 * 1024 * 1024
+
+# Most items certify_batch sends in one request
+MAX_BATCH_ITEMS = 100
+
+# Retry objects are never mutated (increment() returns a new one), so every
+# client can share this strategy. Once retries run out the last response is
+# returned rather than raised, so its status and body reach _error_data.
+# 429s are left to _make_request, which honors Retry-After and the pacer.
+_RETRY = Retry(
+    total=3,
+    status_forcelist=(500, 502, 503, 504),
+    backoff_factor=1,
+    raise_on_status=False,
+)
+_ADAPTER_KW = {"pool_connections": 32, "pool_maxsize": 64, "pool_block": False}
+
+# Session-level headers requests would otherwise add; ACCEPT_ENCODING offers
+# br (and zstd) only when urllib3 can decode them
+_SESSION_HEADERS = {"Accept-Encoding": ACCEPT_ENCODING, "Connection": "keep-alive"}
+
+_NETWORK_ERRORS = (requests.exceptions.RequestException,) + (
+    (httpx.HTTPError,) if httpx is not None else ()
+)
+
+
+def _dumps(obj: Dict) -> bytes:
+    """Serialize a request payload, using orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; let json handle them
+
+    return json.dumps(obj).encode("utf-8")
+
+
+# Fastest available decoder, in order orjson -> msgspec -> json. orjson and
+# msgspec raise a ValueError subclass on input they reject, which json.loads
+# then gets a chance to parse
+if orjson is not None:
+    _fast_loads = orjson.loads
+elif msgspec is not None:
+    _fast_loads = msgspec.json.Decoder().decode
+else:
+    _fast_loads = None
+
+
+def _loads(content: bytes) -> Dict:
+    """Parse a response body with orjson, else msgspec, else json."""
+    if _fast_loads is not None:
+        try:
+            return _fast_loads(content)
+        except ValueError:
+            pass
+
+    return json.loads(content)
+
+
+def _error_data(headers, content: bytes) -> Dict:
+    """Error details from a failed response; non-JSON bodies become the message."""
+    if not content:
+        return {}
+
+    if "application/json" in headers.get("Content-Type", ""):
+        try:
+            error_data = _loads(content)
+        except ValueError:
+            pass
+        else:
+            if isinstance(error_data, dict):
+                return error_data
+
+    # e.g. an HTML page from a gateway; keep a short excerpt as the message
+    return {"error": content[:200].decode("utf-8", "replace")}
+
+
+def _encode_content(content: Union[str, bytes]) -> str:
+    """Base64-encode request content, holding as few full-size copies as possible."""
+    raw = content.encode("utf-8") if isinstance(content, str) else content
+
+    # Reject before encoding; the API would refuse it anyway
+    if len(raw) > MAX_CONTENT_BYTES:
+        raise CertNodeError(
+            "Content exceeds 10 MB",
+            status_code=413,
+            error_code="CONTENT_TOO_LARGE",
+        )
+
+    encoded = _b64encode(raw)
+    del raw  # free the UTF-8 copy before the ASCII decode
+    return encoded.decode("ascii")
+
+
+def _content_payload(request: ContentCertificationRequest) -> Dict:
+    """Build the API payload for a content certification request."""
+    return {
+        "contentBase64": _encode_content(request.content),
+        "contentType": request.content_type,
+        "metadata": request.metadata,
+        "provenance": request.provenance,
+    }
+
+
+def _batch_items(
+    requests_list: List[ContentCertificationRequest],
+) -> Tuple[List[Dict], Optional[List[int]]]:
+    """
+    Batch payload items with exact duplicates folded into one submission.
+
+    Returns the unique items and, when any were folded, each request's index
+    into them (None when every item is distinct).
+    """
+    items: List[Dict] = []
+    slots: List[int] = []
+    seen: Dict[Tuple, int] = {}
+    for request in requests_list:
+        item = _content_payload(request)
+        key = (
+            item["contentBase64"],
+            item["contentType"],
+            _dumps(item["metadata"]),
+            _dumps(item["provenance"]),
+        )
+        slot = seen.get(key)
+        if slot is None:
+            slot = seen[key] = len(items)
+            items.append(item)
+        slots.append(slot)
+
+    return items, (slots if len(items) < len(slots) else None)
+
+
+def _batch_results(response: Dict, items: List[Dict], slots: Optional[List[int]]) -> List:
+    """Map a batch response back to request order, one result per submitted item."""
+    results = response.get("results") if isinstance(response, dict) else None
+    if not isinstance(results, list) or len(results) != len(items):
+        raise CertNodeError(
+            f"Batch response has {len(results) if isinstance(results, list) else 'no'} "
+            f"results for {len(items)} items",
+            error_code="INVALID_RESPONSE",
+        )
+
+    return results if slots is None else [results[slot] for slot in slots]
+
+
+_H_LIMIT = "x-ratelimit-limit"
+_H_REMAINING = "x-ratelimit-remaining"
+_H_RESET = "x-ratelimit-reset"
+_H_RETRY_AFTER = "retry-after"
+
+
+def _rate_limit_info(headers) -> Optional[RateLimitInfo]:
+    """Extract rate limit information from response headers."""
+    # Most responses carry no rate limit headers; stop after one lookup
+    limit = headers.get(_H_LIMIT)
+    if not limit:
+        return None
+
+    remaining = headers.get(_H_REMAINING)
+    reset = headers.get(_H_RESET)
+    if not (remaining and reset):
+        return None
+
+    retry_after = headers.get(_H_RETRY_AFTER)
+    try:
+        return RateLimitInfo(
+            limit=int(limit),
+            remaining=int(remaining),
+            reset=int(reset),
+            retry_after=int(retry_after) if retry_after else None,
+        )
+    except ValueError:
+        # Malformed headers (e.g. an HTTP-date Retry-After) carry no usable info
+        return None
+
+
+def _retry_delay(
+    rate_limit_info: Optional[RateLimitInfo],
+    rand: random.Random,
+    base: float,
+    cap: float,
+    previous: float,
+) -> float:
+    """
+    Seconds to wait before retrying a 429.
+
+    Honors Retry-After exactly; otherwise uses decorrelated jitter,
+    min(cap, uniform(base, previous * 3)), so clients don't retry in lockstep.
+    """
+    retry_after = rate_limit_info["retry_after"] if rate_limit_info else None
+    if retry_after is not None:
+        return retry_after
+
+    return min(cap, rand.uniform(base, max(previous, base) * 3))
+
+
+class _RateLimitPacer:
+    """
+    Client-side admission control driven by X-RateLimit-* feedback.
+
+    Once remaining/limit drops below low_water, requests are spread evenly
+    over the time left until the window resets, instead of spending the
+    budget and then backing off on 429s.
+    """
+
+    def __init__(self, low_water: float = 0.1):
+        self.low_water = low_water
+        self._remaining: Optional[int] = None
+        self._threshold = 0
+        self._reset_at = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, info: Optional[RateLimitInfo]) -> None:
+        """Update the window from a response's rate limit headers."""
+        if info is None:
+            return
+
+        # X-RateLimit-Reset may be an epoch timestamp or seconds until reset
+        reset = info["reset"]
+        seconds = reset - time.time() if reset > 1_000_000_000 else reset
+
+        with self._lock:
+            self._remaining = info["remaining"]
+            self._threshold = info["limit"] * self.low_water
+            self._reset_at = time.monotonic() + max(0.0, seconds)
+
+    def delay(self, cap: float) -> float:
+        """Seconds to wait before issuing the next request (at most cap)."""
+        with self._lock:
+            if self._remaining is None or self._remaining >= self._threshold:
+                return 0.0
+
+            window = self._reset_at - time.monotonic()
+            if window <= 0:
+                self._remaining = None
+                return 0.0
+
+            # Claim a slot so concurrent callers spread out before feedback arrives
+            remaining = self._remaining
+            self._remaining = max(0, remaining - 1)
+            return min(cap, window / (remaining + 1))
+
+
+def _cache_policy(headers) -> Tuple[bool, Optional[float]]:
+    """
+    (cacheable, max_age seconds or None) from a response's Cache-Control.
+
+    "private" is treated like no-store: the cache is shared by every caller
+    of the client, which may be serving more than one end user.
+    """
+    cache_control = headers.get("Cache-Control")
+    if not cache_control:
+        return True, None
+
+    max_age = None
+    for directive in cache_control.lower().split(","):
+        name, _, value = directive.strip().partition("=")
+        if name in ("no-store", "no-cache", "private"):
+            return False, None
+        if name == "max-age":
+            try:
+                max_age = float(value.strip('"'))
+            except ValueError:
+                return False, None
+
+    if max_age is not None and max_age <= 0:
+        return False, None
+    return True, max_age
+
+
+class _ResponseCache:
+    """Thread-safe LRU of parsed responses with optional per-entry expiry."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires, value = entry
+            if expires is not None and time.monotonic() >= expires:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: Dict, max_age: Optional[float] = None) -> None:
+        if self.maxsize <= 0:
+            return
+
+        expires = time.monotonic() + max_age if max_age is not None else None
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
 
 class CertNodeError(Exception):
     """Exception raised for CertNode API errors."""
@@ -37,7 +374,14 @@ class CertNodeError(Exception):
 
 
 class CertNodeClient:
-    """Official Python client for the CertNode Content Authenticity API."""
+    """
+    Official Python client for the CertNode Content Authenticity API.
+
+    The client keeps a pooled keep-alive session; use it as a context
+    manager (or call close()) to release the connections when done. With
+    use_http2=True (and httpx[http2] installed) requests are multiplexed
+    over HTTP/2 instead, so parallel callers share one connection.
+    """
 
     def __init__(
         self,
@@ -45,6 +389,11 @@ class CertNodeClient:
         base_url: str = "https://certnode.io/api/v1",
         timeout: int = 30,
         retries: int = 3,
+        backoff_base: float = 0.1,
+        backoff_cap: float = 10.0,
+        verify_cache_size: int = 1024,
+        adaptive_rate_limit: bool = True,
+        use_http2: bool = False,
     ):
         """
         Initialize the CertNode client.
@@ -54,29 +403,70 @@ class CertNodeClient:
             base_url: API base URL (default: https://certnode.io/api/v1)
             timeout: Request timeout in seconds (default: 30)
             retries: Number of retry attempts for rate limiting (default: 3)
+            backoff_base: Minimum rate-limit backoff in seconds (default: 0.1)
+            backoff_cap: Maximum rate-limit backoff in seconds (default: 10)
+            verify_cache_size: Verification responses kept in memory, 0 to
+                disable (default: 1024)
+            adaptive_rate_limit: Pace requests from X-RateLimit-* headers
+                when the remaining budget runs low (default: True)
+            use_http2: Send requests over an HTTP/2 httpx client, with the
+                same connect and 5xx retry policy as the requests session;
+                falls back to that session when httpx[http2] is not
+                installed (default: False)
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self._rand = random.Random()
+        self._verify_cache = _ResponseCache(verify_cache_size)
+        self._pacer = _RateLimitPacer() if adaptive_rate_limit else None
+
+        # Endpoint URLs, built once
+        self._url_content = self.base_url + "/receipts/content"
+        self._url_batch = self.base_url + "/receipts/content/batch"
+        self._url_usage = self.base_url + "/usage"
+        self._verify_prefix = self.base_url + "/verify/content/"
+
+        headers = {
+            "X-API-Key": self.api_key,
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "User-Agent": _DEFAULT_UA,
+        }
+
+        self._http2 = use_http2 and httpx is not None
+        if self._http2:
+            # The transport retries failed connects; _send applies _RETRY's
+            # status retries itself, since urllib3 is not underneath
+            transport = httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                retries=_RETRY.total,
+            )
+            self.session = httpx.Client(transport=transport, timeout=timeout, headers=headers)
+            return
 
         # Configure session with retry strategy
         self.session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            status_forcelist=[429, 500, 502, 503, 504],
-            backoff_factor=1,
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(max_retries=_RETRY, **_ADAPTER_KW)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
-        # Set default headers
-        self.session.headers.update({
-            "X-API-Key": self.api_key,
-            "Content-Type": "application/json",
-            "User-Agent": f"certnode-python/2.0.0 (Python)",
-        })
+        # Replace the requests defaults outright instead of merging into them
+        self.session.headers = CaseInsensitiveDict({**_SESSION_HEADERS, **headers})
+
+    def close(self) -> None:
+        """Close the underlying session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "CertNodeClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def certify_content(self, request: ContentCertificationRequest) -> CertificationResponse:
         """
@@ -91,25 +481,17 @@ class CertNodeClient:
         Raises:
             CertNodeError: If the API request fails
         """
-        # Convert content to base64
-        if isinstance(request.content, str):
-            content_base64 = base64.b64encode(request.content.encode()).decode()
-        else:
-            content_base64 = base64.b64encode(request.content).decode()
-
-        payload = {
-            "contentBase64": content_base64,
-            "contentType": request.content_type,
-            "metadata": request.metadata,
-            "provenance": request.provenance,
-        }
-
-        return self._make_request("POST", "/receipts/content", payload)
+        payload = _content_payload(request)
+        return self._post(self._url_content, payload)
 
     def verify_content(self, receipt_id: str) -> VerificationResponse:
         """
         Verify a content receipt.
 
+        Receipts are immutable once signed, so responses are cached per
+        receipt ID (honoring Cache-Control max-age / no-store). Cached
+        responses are shared between callers and should not be mutated.
+
         Args:
             receipt_id: The receipt ID to verify
 
@@ -119,7 +501,19 @@ class CertNodeClient:
         Raises:
             CertNodeError: If the API request fails
         """
-        return self._make_request("GET", f"/verify/content/{receipt_id}")
+        cached = self._verify_cache.get(receipt_id)
+        if cached is not None:
+            return cached
+
+        result, headers = self._make_request("GET", self._verify_prefix + receipt_id)
+        cacheable, max_age = _cache_policy(headers)
+        if cacheable:
+            self._verify_cache.put(receipt_id, result, max_age)
+        return result
+
+    def clear_verify_cache(self) -> None:
+        """Drop all cached verification responses."""
+        self._verify_cache.clear()
 
     def certify_batch(
         self, requests_list: List[ContentCertificationRequest]
@@ -127,6 +521,10 @@ class CertNodeClient:
         """
         Batch certify multiple content items.
 
+        Identical items (same content, type, metadata and provenance) are
+        sent once, and their positions in the returned list share the same
+        result dict; copy a result before mutating it.
+
         Args:
             requests_list: List of content certification requests (max 100)
 
@@ -136,30 +534,48 @@ class CertNodeClient:
         Raises:
             CertNodeError: If the API request fails or batch size exceeds limit
         """
-        if len(requests_list) > 100:
+        if len(requests_list) > MAX_BATCH_ITEMS:
             raise CertNodeError(
-                "Batch size cannot exceed 100 items",
+                f"Batch size cannot exceed {MAX_BATCH_ITEMS} items",
                 status_code=400,
                 error_code="BATCH_SIZE_EXCEEDED",
             )
 
-        items = []
-        for req in requests_list:
-            if isinstance(req.content, str):
-                content_base64 = base64.b64encode(req.content.encode()).decode()
-            else:
-                content_base64 = base64.b64encode(req.content).decode()
+        items, slots = _batch_items(requests_list)
+        return _batch_results(self._post(self._url_batch, {"items": items}), items, slots)
+
+    def certify_many(
+        self, requests_list: List[ContentCertificationRequest], max_workers: int = 8
+    ) -> List[CertificationResponse]:
+        """
+        Certify any number of content items, in concurrent batches.
 
-            items.append({
-                "contentBase64": content_base64,
-                "contentType": req.content_type,
-                "metadata": req.metadata,
-                "provenance": req.provenance,
-            })
+        Items are split into batches of up to MAX_BATCH_ITEMS, which are
+        sent in parallel over the pooled session.
 
-        payload = {"items": items}
-        response = self._make_request("POST", "/receipts/content/batch", payload)
-        return response["results"]
+        Args:
+            requests_list: List of content certification requests
+            max_workers: Maximum number of batches in flight (default: 8)
+
+        Returns:
+            List of CertificationResponse objects, in the order of requests_list
+
+        Raises:
+            CertNodeError: If any batch request fails
+        """
+        chunks = [
+            requests_list[i:i + MAX_BATCH_ITEMS]
+            for i in range(0, len(requests_list), MAX_BATCH_ITEMS)
+        ]
+        if len(chunks) <= 1 or max_workers <= 1:
+            return [result for chunk in chunks for result in self.certify_batch(chunk)]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            return [
+                result
+                for batch in executor.map(self.certify_batch, chunks)
+                for result in batch
+            ]
 
     def get_usage_stats(self) -> UsageStats:
         """
@@ -171,71 +587,88 @@ class CertNodeClient:
         Raises:
             CertNodeError: If the API request fails
         """
-        return self._make_request("GET", "/usage")
+        return self._get(self._url_usage)
+
+    def _get(self, url: str) -> Dict:
+        """GET url with retry logic."""
+        return self._make_request("GET", url)[0]
+
+    def _post(self, url: str, data: Dict) -> Dict:
+        """POST data as JSON to url with retry logic."""
+        return self._make_request("POST", url, data)[0]
 
     def _make_request(
         self,
         method: str,
-        endpoint: str,
+        url: str,
         data: Optional[Dict] = None,
-        attempt: int = 1,
-    ) -> Dict:
-        """Make an HTTP request with retry logic."""
-        url = f"{self.base_url}{endpoint}"
+    ) -> Tuple[Dict, Mapping[str, str]]:
+        """Make an HTTP request with retry logic; returns (parsed body, headers)."""
+        body = _dumps(data) if data is not None else None
+        delay = self.backoff_base
+        backed_off = False
 
         try:
-            if method == "GET":
-                response = self.session.get(url, timeout=self.timeout)
-            elif method == "POST":
-                response = self.session.post(url, json=data, timeout=self.timeout)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-
-            # Extract rate limit info
-            rate_limit_info = self._extract_rate_limit_info(response)
-
-            # Handle rate limiting
-            if response.status_code == 429 and attempt <= self.retries:
-                wait_time = (
-                    rate_limit_info.get("retry_after", 2**attempt)
-                    if rate_limit_info
-                    else 2**attempt
-                )
-                time.sleep(wait_time)
-                return self._make_request(method, endpoint, data, attempt + 1)
-
-            # Handle other errors
-            if not response.ok:
-                error_data = response.json() if response.content else {}
-                raise CertNodeError(
-                    error_data.get("error", "API request failed"),
-                    status_code=response.status_code,
-                    error_code=error_data.get("code", "UNKNOWN_ERROR"),
-                    rate_limit_info=rate_limit_info,
-                )
-
-            return response.json()
-
-        except requests.exceptions.RequestException as e:
+            for attempt in range(self.retries + 1):
+                # Right after a 429 backoff the wait for this window is already paid
+                if self._pacer is not None and not backed_off:
+                    pause = self._pacer.delay(self.backoff_cap)
+                    if pause:
+                        time.sleep(pause)
+                backed_off = False
+
+                response = self._send(method, url, body)
+
+                # Extract rate limit info
+                rate_limit_info = self._extract_rate_limit_info(response)
+                if self._pacer is not None:
+                    self._pacer.observe(rate_limit_info)
+
+                # Handle rate limiting
+                if response.status_code == 429 and attempt < self.retries:
+                    delay = _retry_delay(
+                        rate_limit_info, self._rand, self.backoff_base, self.backoff_cap, delay
+                    )
+                    time.sleep(delay)
+                    backed_off = True
+                    continue
+
+                # Handle other errors
+                if response.status_code >= 400:
+                    error_data = _error_data(response.headers, response.content)
+                    raise CertNodeError(
+                        error_data.get("error", "API request failed"),
+                        status_code=response.status_code,
+                        error_code=error_data.get("code", "UNKNOWN_ERROR"),
+                        rate_limit_info=rate_limit_info,
+                    )
+
+                return _loads(response.content), response.headers
+
+        except _NETWORK_ERRORS + (ValueError,) as e:
             raise CertNodeError(f"Network error: {str(e)}", error_code="NETWORK_ERROR")
 
-    def _extract_rate_limit_info(self, response: requests.Response) -> Optional[RateLimitInfo]:
+    def _send(self, method: str, url: str, body: Optional[bytes]):
+        """Send one request on the session; both backends expose status_code/headers/content."""
+        if not self._http2:
+            return self.session.request(method, url, data=body, timeout=self.timeout)
+
+        # Mirror the HTTPAdapter's urllib3 status retries on the httpx client
+        retry = _RETRY
+        while True:
+            response = self.session.request(method, url, content=body)
+            if not retry.is_retry(method, response.status_code, _H_RETRY_AFTER in response.headers):
+                return response
+            try:
+                retry = retry.increment(method, url)
+            except MaxRetryError:
+                return response  # raise_on_status=False: hand back the last response
+            response.close()
+            retry.sleep(response)  # backoff, or the response's Retry-After
+
+    def _extract_rate_limit_info(self, response) -> Optional[RateLimitInfo]:
         """Extract rate limit information from response headers."""
-        headers = response.headers
-        limit = headers.get("X-RateLimit-Limit")
-        remaining = headers.get("X-RateLimit-Remaining")
-        reset = headers.get("X-RateLimit-Reset")
-        retry_after = headers.get("Retry-After")
-
-        if limit and remaining and reset:
-            return RateLimitInfo(
-                limit=int(limit),
-                remaining=int(remaining),
-                reset=int(reset),
-                retry_after=int(retry_after) if retry_after else None,
-            )
-
-        return None
+        return _rate_limit_info(response.headers)
 
 
 def create_client(api_key: str, **kwargs) -> CertNodeClient:
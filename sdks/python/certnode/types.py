@@ -71,6 +71,8 @@ class UsageStats(TypedDict):
 class ContentCertificationRequest:
     """Request for content certification."""
 
+    __slots__ = ("content", "content_type", "metadata", "provenance")
+
     def __init__(
         self,
         content: Union[str, bytes],
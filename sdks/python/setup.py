@@ -39,8 +39,23 @@ setup(
         "typing-extensions>=4.0.0",
     ],
     extras_require={
+        "async": [
+            "httpx>=0.24.0",
+        ],
+        "http2": [
+            "httpx[http2]>=0.24.0",
+        ],
+        # Response decoding uses orjson, then msgspec, then the json module,
+        # whichever is installed first; "fast" also speeds up request encoding
+        "fast": [
+            "orjson>=3.9.0",
+        ],
+        "msgspec": [
+            "msgspec>=0.18",
+        ],
         "dev": [
             "pytest>=7.0.0",
+            "httpx[http2]>=0.24.0",
             "pytest-cov>=4.0.0",
             "black>=22.0.0",
             "flake8>=5.0.0",
@@ -0,0 +1,529 @@
+"""Tests for the CertNode sync and async clients."""
+
+import asyncio
+import json
+import pickle
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+import urllib3.util.retry
+
+from certnode import (
+    AsyncCertNodeClient,
+    CertNodeClient,
+    CertNodeError,
+    ContentCertificationRequest,
+)
+import certnode.client
+from certnode.client import (
+    MAX_BATCH_ITEMS,
+    MAX_CONTENT_BYTES,
+    _cache_policy,
+    _encode_content,
+    _RateLimitPacer,
+    _ResponseCache,
+)
+
+
+def test_error_pickle_round_trip():
+    error = CertNodeError(
+        "slow down",
+        status_code=429,
+        error_code="RATE",
+        rate_limit_info={"limit": 10, "remaining": 0, "reset": 60, "retry_after": 5},
+    )
+
+    restored = pickle.loads(pickle.dumps(error))
+
+    assert restored.message == "slow down"
+    assert restored.status_code == 429
+    assert restored.error_code == "RATE"
+    assert restored.rate_limit_info == error.rate_limit_info
+    assert str(restored) == str(error)
+
+
+def test_oversize_content_rejected_before_encoding():
+    content = "a" * (MAX_CONTENT_BYTES + 1)
+
+    with pytest.raises(CertNodeError) as excinfo:
+        _encode_content(content)
+
+    assert excinfo.value.status_code == 413
+    assert excinfo.value.error_code == "CONTENT_TOO_LARGE"
+    assert _encode_content("hé") == "aMOp"
+
+
+class _GatewayTimeout(BaseHTTPRequestHandler):
+    """Answers every GET like a proxy whose upstream timed out."""
+
+    def do_GET(self):
+        body = b"<html><body><h1>504 Gateway Time-out</h1></body></html>"
+        self.send_response(504)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def gateway_url(monkeypatch):
+    # urllib3 backs off between its status retries; skip the waits
+    monkeypatch.setattr("urllib3.util.retry.time.sleep", lambda seconds: None)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _GatewayTimeout)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/api/v1"
+    server.shutdown()
+    server.server_close()
+
+
+def test_html_5xx_reports_status_not_network_error(gateway_url):
+    with CertNodeClient("key", base_url=gateway_url) as client:
+        with pytest.raises(CertNodeError) as excinfo:
+            client.verify_content("receipt-1")
+
+    assert excinfo.value.status_code == 504
+    assert excinfo.value.error_code == "UNKNOWN_ERROR"
+    assert "504 Gateway Time-out" in excinfo.value.message
+
+
+class FakeResponse:
+    """Just enough of requests.Response for _make_request."""
+
+    def __init__(self, status_code=200, body=None, headers=None, content=None):
+        self.status_code = status_code
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+        self.content = content if content is not None else json.dumps(body).encode("utf-8")
+
+
+def fake_session(client, handler):
+    """Route the client's requests to handler(method, url, body) -> FakeResponse."""
+    calls = []
+
+    def request(method, url, data=None, **kwargs):
+        calls.append((method, url, data))
+        return handler(method, url, data)
+
+    client.session.request = request
+    return calls
+
+
+def async_client(handler, **kwargs):
+    """AsyncCertNodeClient whose transport calls handler(httpx.Request) -> httpx.Response."""
+    client = AsyncCertNodeClient("key", base_url="http://certnode.test/api/v1", **kwargs)
+    client.client._transport = httpx.MockTransport(handler)
+    return client
+
+
+def test_malformed_success_body_is_network_error():
+    client = CertNodeClient("key")
+    fake_session(client, lambda method, url, body: FakeResponse(content=b"not json"))
+
+    with pytest.raises(CertNodeError) as excinfo:
+        client.get_usage_stats()
+
+    assert excinfo.value.error_code == "NETWORK_ERROR"
+
+
+def test_async_malformed_success_body_is_network_error():
+    client = async_client(lambda request: httpx.Response(200, content=b"not json"))
+
+    async def run():
+        async with client:
+            await client.get_usage_stats()
+
+    with pytest.raises(CertNodeError) as excinfo:
+        asyncio.run(run())
+
+    assert excinfo.value.error_code == "NETWORK_ERROR"
+
+
+class _Flaky(BaseHTTPRequestHandler):
+    """Fails every request with 503 until `failures` have been served."""
+
+    protocol_version = "HTTP/1.1"
+    failures = 0
+    calls = []
+
+    def _reply(self):
+        self.calls.append(self.command)
+        if self.command == "POST":
+            self.rfile.read(int(self.headers["Content-Length"]))
+        if len(self.calls) <= self.failures:
+            status, body = 503, b'{"error": "busy"}'
+        else:
+            status, body = 200, b'{"ok": true}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def flaky_server(monkeypatch):
+    monkeypatch.setattr(urllib3.util.retry.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(_Flaky, "calls", [])
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Flaky)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("use_http2", [False, True])
+@pytest.mark.parametrize(
+    "method, failures, expected_status, expected_calls",
+    [
+        ("GET", 2, 200, 3),  # 5xx GETs are retried
+        ("GET", 10, 503, 4),  # ...up to _RETRY.total times, then surfaced
+        ("POST", 1, 503, 1),  # POSTs are never replayed
+    ],
+)
+def test_backends_retry_5xx_alike(
+    flaky_server, monkeypatch, use_http2, method, failures, expected_status, expected_calls
+):
+    if use_http2:
+        pytest.importorskip("h2")
+    monkeypatch.setattr(_Flaky, "failures", failures)
+    base_url = f"http://127.0.0.1:{flaky_server.server_address[1]}/api/v1"
+
+    with CertNodeClient("key", base_url=base_url, use_http2=use_http2) as client:
+        assert client._http2 is use_http2
+        if expected_status == 200:
+            client._make_request(method, base_url + "/usage", {} if method == "POST" else None)
+        else:
+            with pytest.raises(CertNodeError) as excinfo:
+                client._make_request(method, base_url + "/usage", {} if method == "POST" else None)
+            assert excinfo.value.status_code == expected_status
+
+    assert _Flaky.calls == [method] * expected_calls
+
+
+def echo_batch(method, url, body):
+    """Batch endpoint stand-in: one result per item, naming its content and metadata."""
+    items = json.loads(body)["items"]
+    return FakeResponse(body={
+        "results": [{"content": item["contentBase64"], "metadata": item["metadata"]} for item in items]
+    })
+
+
+def test_certify_batch_sends_duplicates_once_in_order():
+    client = CertNodeClient("key")
+    calls = fake_session(client, echo_batch)
+    requests_list = [
+        ContentCertificationRequest("a", "text/plain"),
+        ContentCertificationRequest("b", "text/plain"),
+        ContentCertificationRequest(b"a", "text/plain"),  # same bytes as "a"
+        ContentCertificationRequest("a", "text/plain", metadata={"v": 2}),
+        ContentCertificationRequest("a", "text/plain"),
+    ]
+
+    results = client.certify_batch(requests_list)
+
+    assert len(json.loads(calls[0][2])["items"]) == 3
+    assert [(r["content"], r["metadata"]) for r in results] == [
+        ("YQ==", {}), ("Yg==", {}), ("YQ==", {}), ("YQ==", {"v": 2}), ("YQ==", {}),
+    ]
+    assert results[0] is results[2] is results[4]
+    assert results[0] is not results[3]
+
+
+@pytest.mark.parametrize("body", [{"results": [{}]}, {"results": None}, {}])
+def test_certify_batch_rejects_short_results(body):
+    client = CertNodeClient("key")
+    fake_session(client, lambda method, url, data: FakeResponse(body=body))
+    requests_list = [
+        ContentCertificationRequest("a", "text/plain"),
+        ContentCertificationRequest("b", "text/plain"),
+    ]
+
+    with pytest.raises(CertNodeError) as excinfo:
+        client.certify_batch(requests_list)
+
+    assert excinfo.value.error_code == "INVALID_RESPONSE"
+
+
+def test_async_certify_batch_rejects_short_results():
+    client = async_client(lambda request: httpx.Response(200, json={"results": []}))
+
+    async def run():
+        async with client:
+            await client.certify_batch([ContentCertificationRequest("a", "text/plain")])
+
+    with pytest.raises(CertNodeError) as excinfo:
+        asyncio.run(run())
+
+    assert excinfo.value.error_code == "INVALID_RESPONSE"
+
+
+def counting_verify(cache_control=None):
+    """Verify endpoint stand-in that numbers its responses."""
+    served = []
+
+    def handler(method, url, body):
+        served.append(url)
+        headers = {"Cache-Control": cache_control} if cache_control else {}
+        return FakeResponse(body={"valid": True, "n": len(served)}, headers=headers)
+
+    return handler, served
+
+
+@pytest.mark.parametrize(
+    "cache_control, expected",
+    [
+        (None, (True, None)),
+        ("public, max-age=60", (True, 60.0)),
+        ("no-store", (False, None)),
+        ("no-cache", (False, None)),
+        ("private, max-age=60", (False, None)),
+        ("max-age=0", (False, None)),
+        ("max-age=soon", (False, None)),
+    ],
+)
+def test_cache_policy(cache_control, expected):
+    headers = {"Cache-Control": cache_control} if cache_control else {}
+    assert _cache_policy(headers) == expected
+
+
+@pytest.mark.parametrize("cache_control", ["no-store", "no-cache", "private"])
+def test_verify_content_skips_uncacheable_responses(cache_control):
+    client = CertNodeClient("key")
+    handler, served = counting_verify(cache_control)
+    fake_session(client, handler)
+
+    assert client.verify_content("r1")["n"] == 1
+    assert client.verify_content("r1")["n"] == 2
+
+
+def test_verify_content_caches_until_max_age(clock):
+    now = clock
+    client = CertNodeClient("key")
+    handler, served = counting_verify("max-age=30")
+    fake_session(client, handler)
+
+    assert client.verify_content("r1")["n"] == 1
+    now[0] += 29
+    assert client.verify_content("r1")["n"] == 1
+    now[0] += 1
+    assert client.verify_content("r1")["n"] == 2
+    assert len(served) == 2
+
+
+def test_verify_cache_evicts_least_recently_used():
+    client = CertNodeClient("key", verify_cache_size=2)
+    handler, served = counting_verify()
+    fake_session(client, handler)
+
+    client.verify_content("r1")
+    client.verify_content("r2")
+    client.verify_content("r1")  # r2 is now least recently used
+    client.verify_content("r3")
+    assert len(served) == 3
+
+    client.verify_content("r1")
+    assert len(served) == 3
+    client.verify_content("r2")
+    assert len(served) == 4
+
+
+def test_verify_cache_size_zero_disables_cache():
+    client = CertNodeClient("key", verify_cache_size=0)
+    handler, served = counting_verify()
+    fake_session(client, handler)
+
+    client.verify_content("r1")
+    client.verify_content("r1")
+    assert len(served) == 2
+
+
+def test_clear_verify_cache():
+    client = CertNodeClient("key")
+    handler, served = counting_verify()
+    fake_session(client, handler)
+
+    client.verify_content("r1")
+    client.clear_verify_cache()
+    client.verify_content("r1")
+    assert len(served) == 2
+
+
+def test_response_cache_is_thread_safe():
+    cache = _ResponseCache(64)
+
+    def churn(worker):
+        for i in range(2000):
+            key = f"{worker}-{i % 100}"
+            cache.put(key, {"i": i})
+            cache.get(key)
+
+    threads = [threading.Thread(target=churn, args=(worker,)) for worker in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(cache._entries) == 64
+
+
+def rate_limit(remaining, limit=100, reset=30):
+    return {"limit": limit, "remaining": remaining, "reset": reset, "retry_after": None}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controlled time.monotonic for the pacer and cache."""
+    now = [1000.0]
+    monkeypatch.setattr(certnode.client.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_pacer_waits_only_under_threshold(clock):
+    pacer = _RateLimitPacer()
+    assert pacer.delay(10) == 0.0  # nothing observed yet
+
+    pacer.observe(rate_limit(remaining=10))  # exactly 10% left
+    assert pacer.delay(10) == 0.0
+
+    pacer.observe(rate_limit(remaining=3, reset=20))
+    assert pacer.delay(10) == pytest.approx(20 / 4)
+
+
+def test_pacer_claims_a_slot_per_admission(clock):
+    pacer = _RateLimitPacer()
+    pacer.observe(rate_limit(remaining=3, reset=60))
+
+    delays = [pacer.delay(100) for _ in range(5)]
+
+    # 60s window shared by the 3 remaining requests, then nothing is left
+    assert delays == pytest.approx([60 / 4, 60 / 3, 60 / 2, 60, 60])
+    assert pacer.delay(10) == 10  # capped
+
+
+def test_pacer_resets_when_window_expires(clock):
+    pacer = _RateLimitPacer()
+    pacer.observe(rate_limit(remaining=0, reset=5))
+    assert pacer.delay(10) == pytest.approx(5)
+
+    clock[0] += 5
+    assert pacer.delay(10) == 0.0
+    assert pacer.delay(10) == 0.0  # stays clear until new feedback
+
+
+def test_pacer_accepts_epoch_reset(clock):
+    pacer = _RateLimitPacer()
+    pacer.observe(rate_limit(remaining=0, reset=int(certnode.client.time.time()) + 8))
+    assert 6 < pacer.delay(10) <= 8
+
+
+def test_no_pacer_wait_right_after_429_backoff(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(certnode.client.time, "sleep", sleeps.append)
+    throttled = {"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"}
+    responses = [
+        FakeResponse(429, {"error": "slow"}, {k.lower(): v for k, v in throttled.items()}),
+        FakeResponse(body={"ok": True}),
+    ]
+    client = CertNodeClient("key", backoff_cap=5.0)
+    fake_session(client, lambda method, url, body: responses.pop(0))
+
+    assert client.get_usage_stats() == {"ok": True}
+    assert len(sleeps) == 1  # the 429 backoff only, no extra pacer wait
+
+
+def numbered_requests(count):
+    return [
+        ContentCertificationRequest(f"item {i}", "text/plain", metadata={"n": i})
+        for i in range(count)
+    ]
+
+
+def test_certify_many_chunks_and_keeps_order():
+    client = CertNodeClient("key")
+    lock = threading.Lock()
+    sizes = []
+
+    def handler(method, url, body):
+        with lock:
+            sizes.append(len(json.loads(body)["items"]))
+        return echo_batch(method, url, body)
+
+    fake_session(client, handler)
+
+    results = client.certify_many(numbered_requests(2 * MAX_BATCH_ITEMS + 50), max_workers=3)
+
+    assert sorted(sizes) == [50, MAX_BATCH_ITEMS, MAX_BATCH_ITEMS]
+    assert [r["metadata"]["n"] for r in results] == list(range(2 * MAX_BATCH_ITEMS + 50))
+    assert client.certify_many([]) == []
+
+
+def test_certify_many_raises_when_a_batch_fails():
+    client = CertNodeClient("key")
+
+    def handler(method, url, body):
+        items = json.loads(body)["items"]
+        if items[0]["metadata"]["n"] == MAX_BATCH_ITEMS:
+            return FakeResponse(500, {"error": "boom", "code": "PROCESSING_FAILED"})
+        return echo_batch(method, url, body)
+
+    fake_session(client, handler)
+
+    with pytest.raises(CertNodeError) as excinfo:
+        client.certify_many(numbered_requests(3 * MAX_BATCH_ITEMS))
+
+    assert excinfo.value.status_code == 500
+    assert excinfo.value.error_code == "PROCESSING_FAILED"
+
+
+def async_echo_batch(request):
+    items = json.loads(request.content)["items"]
+    if items[0]["metadata"].get("fail"):
+        return httpx.Response(500, json={"error": "boom", "code": "PROCESSING_FAILED"})
+    return httpx.Response(200, json={"results": [{"metadata": item["metadata"]} for item in items]})
+
+
+def test_async_certify_many_chunks_and_keeps_order():
+    sizes = []
+
+    def handler(request):
+        sizes.append(len(json.loads(request.content)["items"]))
+        return async_echo_batch(request)
+
+    client = async_client(handler)
+
+    async def run():
+        async with client:
+            return await client.certify_many(numbered_requests(2 * MAX_BATCH_ITEMS + 1), concurrency=2)
+
+    results = asyncio.run(run())
+
+    assert sorted(sizes) == [1, MAX_BATCH_ITEMS, MAX_BATCH_ITEMS]
+    assert [r["metadata"]["n"] for r in results] == list(range(2 * MAX_BATCH_ITEMS + 1))
+
+
+def test_async_certify_many_raises_when_a_batch_fails():
+    requests_list = numbered_requests(2 * MAX_BATCH_ITEMS)
+    requests_list[MAX_BATCH_ITEMS].metadata["fail"] = True
+    client = async_client(async_echo_batch)
+
+    async def run():
+        async with client:
+            await client.certify_many(requests_list)
+
+    with pytest.raises(CertNodeError) as excinfo:
+        asyncio.run(run())
+
+    assert excinfo.value.status_code == 500
@@ -1,10 +1,11 @@
 ﻿import json
 import os
+import queue
 import subprocess
 import sys
+import threading
 import time
-import urllib.request
-import urllib.error
+from http.client import HTTPConnection
 
 project_dir = r"C:\Dev\certnode\nextjs-pricing"
 cmd = ['C:\\Program Files\\nodejs\\npx.cmd', 'next', 'dev', '--hostname', '127.0.0.1', '--port', '3201']
@@ -16,39 +17,61 @@ def start_server():
 proc = start_server()
 
 
-def wait_for_ready(process, timeout=120):
+def start_drain(process):
+    # Keep reading the server's output for its whole lifetime so the pipe
+    # never fills and blocks the child; None marks end of output
+    lines = queue.Queue()
+
+    def drain():
+        for line in iter(process.stdout.readline, ''):
+            lines.put(line)
+        lines.put(None)
+
+    threading.Thread(target=drain, daemon=True).start()
+    return lines
+
+
+output = start_drain(proc)
+
+
+def wait_for_ready(process, lines, timeout=120):
     start = time.time()
     while time.time() - start < timeout:
-        line = process.stdout.readline()
-        if line:
-            sys.stdout.write(line)
-            sys.stdout.flush()
-            lower = line.lower()
-            if 'started server on' in lower or 'ready - local' in lower or 'url:' in lower:
-                return True
-        elif process.poll() is not None:
-            raise RuntimeError('Dev server exited early with code {}'.format(process.poll()))
+        try:
+            line = lines.get(timeout=1)
+        except queue.Empty:
+            continue
+        if line is None:
+            raise RuntimeError('Dev server exited early with code {}'.format(process.wait()))
+        sys.stdout.write(line)
+        sys.stdout.flush()
+        lower = line.lower()
+        if 'started server on' in lower or 'ready - local' in lower or 'url:' in lower:
+            return True
     return False
 
 
+# One keep-alive connection for every request; it reconnects on its own
+# after close()
+conn = HTTPConnection('127.0.0.1', 3201, timeout=15)
+
+
 def post(payload):
-    req = urllib.request.Request(
-        'http://127.0.0.1:3201/api/checkout',
-        data=json.dumps(payload).encode('utf-8'),
-        headers={'Content-Type': 'application/json'},
-        method='POST'
-    )
     try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            body = resp.read().decode('utf-8')
-            return resp.status, body
-    except urllib.error.HTTPError as exc:
-        return exc.code, exc.read().decode('utf-8')
+        conn.request(
+            'POST',
+            '/api/checkout',
+            body=json.dumps(payload).encode('utf-8'),
+            headers={'Content-Type': 'application/json', 'Connection': 'keep-alive'},
+        )
+        resp = conn.getresponse()
+        return resp.status, resp.read().decode('utf-8')
     except Exception as exc:
+        conn.close()
         return None, str(exc)
 
 try:
-    if not wait_for_ready(proc):
+    if not wait_for_ready(proc, output):
         raise RuntimeError('Dev server did not become ready within timeout')
 
     time.sleep(3)
@@ -59,6 +82,7 @@ try:
     monthly_status, monthly_body = post({'tier': 'starter', 'billing': 'monthly', 'email': None})
     print('Monthly checkout response:', monthly_status, monthly_body)
 finally:
+    conn.close()
     try:
         proc.terminate()
         proc.wait(timeout=10)